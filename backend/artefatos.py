@@ -0,0 +1,142 @@
+# artefatos dos modelos do /predict/ em formato mapeável em memória
+#
+# Os .pkl originais são lidos com joblib.load e cada worker do uvicorn/gunicorn fica com a
+# sua cópia. Este módulo reexporta os mesmos objetos com joblib.dump sem compressão em
+# models/mmap/: os arrays NumPy ficam alinhados no arquivo e joblib.load(mmap_mode="r") os
+# abre direto do page cache, então N workers compartilham uma única cópia física.
+# A floresta plana (backend/forest.py) é só arrays e se beneficia por inteiro; o
+# RandomForestClassifier do sklearn copia as árvores para estruturas próprias ao carregar.
+#
+# A versão dos modelos é o sha1 do conteúdo dos .pkl de origem, não de caminho ou data: o
+# models/mmap/origem.json (e o campo "origem" do .npz da floresta plana) guarda o hash do .pkl
+# de que cada artefato foi exportado. Assim sklearn, mmap e plano têm a mesma versão, e a
+# tabela de previsões e o cache continuam valendo. Artefato cuja origem não bate com o .pkl
+# atual está desatualizado: o .joblib é ignorado (volta para o .pkl) e o .npz é recusado.
+#
+# Exportação (na raiz do repositório):
+#     python -m backend.artefatos [--destino models/mmap]
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import joblib
+
+from backend.forest import ARQUIVO_PLANO, FlorestaPlana
+from backend.registry import hash_conteudo
+
+ORIGENS = {
+    "imputer": "models/imputer_idade.pkl",
+    "rf_model": "models/modelo_rf.pkl",
+    "le_bairro": "models/encoder_bairro.pkl",
+    "le_crime": "models/encoder_crime.pkl",
+}
+
+DIRETORIO_MMAP = os.getenv("PREDICT_MMAP_DIR", "models/mmap")
+
+# nome do artefato da floresta plana dentro de DIRETORIO_MMAP
+NOME_PLANO = "rf_plano"
+
+# hash do .pkl de origem de cada .joblib exportado, gravado por último na exportação
+MANIFESTO = "origem.json"
+
+
+def _candidatos(nome, motor, diretorio):
+    """Arquivos que podem servir o modelo, em ordem de preferência."""
+    if nome == "rf_model" and motor == "plano":
+        return [os.path.join(diretorio, f"{NOME_PLANO}.joblib"), ARQUIVO_PLANO]
+    return [os.path.join(diretorio, f"{nome}.joblib"), ORIGENS[nome]]
+
+
+def arquivos_monitorados(motor="sklearn", diretorio=DIRETORIO_MMAP):
+    """Tudo que, se mudar, pode mudar os modelos carregados (para o registro vigiar)."""
+    arquivos = set(ORIGENS.values()) | {os.path.join(diretorio, MANIFESTO)}
+    for nome in ORIGENS:
+        arquivos.update(_candidatos(nome, motor, diretorio))
+    return sorted(arquivos)
+
+
+def _origem(caminho):
+    """Hash do .pkl de que o artefato foi exportado (o próprio hash, para um .pkl)."""
+    if caminho.endswith(".npz"):
+        return FlorestaPlana.origem_de(caminho)
+    if caminho.endswith(".joblib"):
+        manifesto = os.path.join(os.path.dirname(caminho), MANIFESTO)
+        if not os.path.exists(manifesto):
+            return None
+        with open(manifesto, "r", encoding="utf-8") as f:
+            return json.load(f).get(os.path.basename(caminho))
+    return hash_conteudo(caminho)
+
+
+def resolver_modelos(motor="sklearn", diretorio=DIRETORIO_MMAP):
+    """(caminho de cada modelo, versão) conferindo que cada artefato corresponde ao .pkl atual."""
+    caminhos, origens = {}, {}
+    for nome, fonte in ORIGENS.items():
+        atual = hash_conteudo(fonte) if os.path.exists(fonte) else None
+        for caminho in _candidatos(nome, motor, diretorio):
+            if not os.path.exists(caminho):
+                continue
+            origem = _origem(caminho)
+            if atual is None or origem == atual:
+                caminhos[nome], origens[nome] = caminho, origem or hash_conteudo(caminho)
+                break
+            aviso = f"{caminho} não foi exportado de {fonte} atual"
+            if caminho.endswith(".npz"):
+                raise RuntimeError(f"{aviso}; rode python -m backend.forest")
+            print(f"[pid {os.getpid()}] {aviso}; ignorado (rode python -m backend.artefatos)")
+        else:
+            raise FileNotFoundError(f"nenhum arquivo para {nome}: {_candidatos(nome, motor, diretorio)}")
+    versao = hashlib.sha1(json.dumps(origens, sort_keys=True).encode()).hexdigest()[:12]
+    return caminhos, versao
+
+
+def carregar(caminho):
+    if caminho.endswith(".npz"):
+        return FlorestaPlana.carregar(caminho)
+    if caminho.endswith(".joblib"):
+        # somente leitura: os arrays são páginas do arquivo, compartilhadas entre processos
+        return joblib.load(caminho, mmap_mode="r")
+    return joblib.load(caminho)
+
+
+def _gravar(obj, destino):
+    tmp = destino + ".tmp"
+    joblib.dump(obj, tmp, compress=0)
+    os.replace(tmp, destino)
+
+
+def exportar(diretorio=DIRETORIO_MMAP):
+    os.makedirs(diretorio, exist_ok=True)
+    origens = {}
+    for nome, origem in ORIGENS.items():
+        obj = joblib.load(origem)
+        origens[f"{nome}.joblib"] = hash_conteudo(origem)
+        _gravar(obj, os.path.join(diretorio, f"{nome}.joblib"))
+        if nome == "rf_model":
+            floresta = FlorestaPlana.de_sklearn(obj)
+            floresta.origem = origens[f"{NOME_PLANO}.joblib"] = hash_conteudo(origem)
+            _gravar(floresta, os.path.join(diretorio, f"{NOME_PLANO}.joblib"))
+
+    # por último: exportação interrompida deixa o manifesto antigo, e os .joblib novos são ignorados
+    manifesto = os.path.join(diretorio, MANIFESTO)
+    with open(manifesto + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(origens, f, indent=2, sort_keys=True)
+    os.replace(manifesto + ".tmp", manifesto)
+    return sorted(os.listdir(diretorio))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta os modelos do /predict/ para carga com mmap")
+    parser.add_argument("--destino", default=DIRETORIO_MMAP)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    arquivos = exportar(args.destino)
+    print(f"{len(arquivos)} artefatos em {args.destino} ({time.perf_counter() - t0:.1f}s): {', '.join(arquivos)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# agrupamento dinâmico de requisições (micro-batching)
+#
+# Chamadas concorrentes de uma única linha entram numa fila. Um coletor junta o que chegar
+# em até max_espera_s depois do primeiro item (ou até max_lote itens), processa o lote inteiro
+# numa thread e devolve a cada chamador o seu próprio resultado. Enquanto um lote roda, os
+# próximos vão se acumulando, então o tamanho do lote cresce junto com a carga.
+
+import asyncio
+import time
+
+
+class Agrupador:
+    """Junta itens submetidos concorrentemente e chama processar(lista) -> lista na mesma ordem."""
+
+    def __init__(self, processar, max_espera_s=0.002, max_lote=64):
+        self.processar = processar
+        self.max_espera_s = max_espera_s
+        self.max_lote = max_lote
+        self._fila = None
+        self._coletor = None
+        self.lotes = 0
+        self.itens = 0
+
+    async def submeter(self, item):
+        if self._coletor is None or self._coletor.done():
+            # a fila e o coletor pertencem ao event loop que está rodando
+            self._fila = asyncio.Queue()
+            self._coletor = asyncio.get_running_loop().create_task(self._coletar())
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((item, futuro))
+        return await futuro
+
+    async def _coletar(self):
+        while True:
+            lote = [await self._fila.get()]
+            prazo = time.perf_counter() + self.max_espera_s
+            while len(lote) < self.max_lote:
+                restante = prazo - time.perf_counter()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._fila.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            # o que já está na fila entra sem esperar (até o limite do lote)
+            while len(lote) < self.max_lote and not self._fila.empty():
+                lote.append(self._fila.get_nowait())
+            await self._executar(lote)
+
+    async def _executar(self, lote):
+        try:
+            resultados = await asyncio.to_thread(self.processar, [item for item, _ in lote])
+        except Exception as e:
+            if len(lote) > 1:
+                # um item inválido não derruba o lote: cada um é refeito sozinho para isolar o erro
+                for entrada in lote:
+                    await self._executar([entrada])
+                return
+            _, futuro = lote[0]
+            if not futuro.done():
+                futuro.set_exception(e)
+            return
+        self.lotes += 1
+        self.itens += len(lote)
+        for (_, futuro), resultado in zip(lote, resultados):
+            # futuro cancelado = cliente desistiu da requisição
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+    def stats(self):
+        return {
+            "max_espera_ms": self.max_espera_s * 1000,
+            "max_lote": self.max_lote,
+            "lotes": self.lotes,
+            "itens": self.itens,
+            "lote_medio": round(self.itens / self.lotes, 2) if self.lotes else 0.0,
+            "na_fila": self._fila.qsize() if self._fila is not None else 0,
+        }
+
+    async def fechar(self):
+        if self._coletor is not None:
+            self._coletor.cancel()
+            try:
+                await self._coletor
+            except asyncio.CancelledError:
+                pass
+            self._coletor = None
@@ -0,0 +1,149 @@
+# floresta aleatória em vetores NumPy contíguos, para inferência sem os objetos de árvore do sklearn
+#
+# Exporta um RandomForestClassifier treinado para vetores planos (feature, threshold, filhos e
+# probabilidades por nó, com as árvores concatenadas) e avalia um lote inteiro descendo todas as
+# árvores ao mesmo tempo. O resultado é idêntico ao predict_proba: X é convertido para float32
+# como no sklearn, as folhas têm os mesmos valores e as árvores são somadas na ordem.
+#
+# Exportação (na raiz do repositório):
+#     python -m backend.forest [models/modelo_rf.pkl] [models/modelo_rf_plano.npz]
+
+import sys
+
+import numpy as np
+
+ARQUIVO_PLANO = "models/modelo_rf_plano.npz"
+
+# até quantas linhas predict_proba soma as árvores numa única redução
+LOTE_REDUCAO = 256
+
+
+class FlorestaPlana:
+    """Mesma interface de inferência do RandomForestClassifier (predict_proba, classes_...)."""
+
+    CAMPOS = ["feature", "threshold", "esquerda", "direita", "valor", "raizes", "classes_", "feature_names_in_"]
+
+    def __init__(self, feature, threshold, esquerda, direita, valor, raizes, classes_, feature_names_in_):
+        self.feature = feature
+        self.threshold = threshold
+        self.esquerda = esquerda
+        self.direita = direita
+        self.valor = valor
+        self.raizes = raizes
+        self.classes_ = classes_
+        self.feature_names_in_ = feature_names_in_
+        self.n_features_in_ = len(feature_names_in_)
+        # sha1 do modelo_rf.pkl exportado: identifica o modelo independente do formato
+        self.origem = None
+
+    @classmethod
+    def de_sklearn(cls, rf):
+        feature, threshold, esquerda, direita, valor, raizes = [], [], [], [], [], []
+        inicio = 0
+        for arvore in rf.estimators_:
+            t = arvore.tree_
+            folha = t.children_left == -1
+            idx = np.arange(t.node_count) + inicio
+            # folhas apontam para si mesmas: descer além da folha não sai do lugar
+            feature.append(np.where(folha, 0, t.feature).astype(np.int32))
+            threshold.append(np.where(folha, np.inf, t.threshold))
+            esquerda.append(np.where(folha, idx, t.children_left + inicio).astype(np.int32))
+            direita.append(np.where(folha, idx, t.children_right + inicio).astype(np.int32))
+            # sklearn >= 1.4 já guarda frações por nó e as devolve sem mexer; versões antigas
+            # guardam contagens e normalizam no predict_proba (mesma conta feita aqui)
+            v = t.value[:, 0, :rf.n_classes_]
+            if not np.allclose(v.sum(axis=1), 1.0):
+                normalizador = v.sum(axis=1)[:, np.newaxis]
+                normalizador[normalizador == 0.0] = 1.0
+                v = v / normalizador
+            valor.append(v)
+            raizes.append(inicio)
+            inicio += t.node_count
+
+        nomes = getattr(rf, "feature_names_in_", np.array([f"x{i}" for i in range(rf.n_features_in_)], dtype=object))
+        return cls(
+            np.concatenate(feature), np.concatenate(threshold), np.concatenate(esquerda),
+            np.concatenate(direita), np.concatenate(valor), np.array(raizes, dtype=np.int32),
+            np.asarray(rf.classes_), np.asarray(nomes, dtype=object),
+        )
+
+    def _folhas(self, X):
+        """Índice (global) da folha de cada linha em cada árvore: matriz árvores x linhas."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n, n_features = X.shape
+        n_arvores = len(self.raizes)
+        Xf = X.ravel()
+        # pares (árvore, linha) na ordem árvore-major; cada par desce até parar numa folha
+        nos = np.repeat(self.raizes, n)
+        base = np.tile(np.arange(n, dtype=np.int64) * n_features, n_arvores)
+        ativos = np.arange(n * n_arvores)
+        while len(ativos):
+            no = nos[ativos]
+            vai_esquerda = Xf[base[ativos] + self.feature[no]] <= self.threshold[no]
+            proximo = np.where(vai_esquerda, self.esquerda[no], self.direita[no])
+            nos[ativos] = proximo
+            # quem chegou numa folha aponta para si mesmo e sai da lista
+            ativos = ativos[proximo != no]
+        return nos.reshape(n_arvores, n)
+
+    def apply(self, X):
+        """Folha de cada linha em cada árvore (linhas x árvores), como RandomForestClassifier.apply."""
+        return (self._folhas(X) - self.raizes[:, np.newaxis]).T
+
+    def predict_proba(self, X):
+        folhas = self._folhas(X)
+        # soma árvore a árvore, na mesma ordem do sklearn, para o arredondamento ser o mesmo.
+        # Reduzir o eixo externo (árvores) também acumula em sequência; para lotes grandes o laço
+        # evita alocar o bloco árvores x linhas x classes inteiro.
+        if folhas.shape[1] <= LOTE_REDUCAO:
+            probs = self.valor[folhas].sum(axis=0)
+        else:
+            probs = np.zeros((folhas.shape[1], self.valor.shape[1]), dtype=np.float64)
+            for folhas_arvore in folhas:
+                probs += self.valor[folhas_arvore]
+        probs /= folhas.shape[0]
+        return probs
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def salvar(self, caminho=ARQUIVO_PLANO):
+        campos = {nome: getattr(self, nome) for nome in self.CAMPOS}
+        campos["feature_names_in_"] = campos["feature_names_in_"].astype(str)
+        campos["classes_"] = np.asarray(campos["classes_"])
+        if self.origem is not None:
+            campos["origem"] = np.array(self.origem)
+        np.savez(caminho, **campos)
+
+    @classmethod
+    def carregar(cls, caminho=ARQUIVO_PLANO):
+        with np.load(caminho, allow_pickle=False) as dados:
+            campos = {nome: dados[nome] for nome in cls.CAMPOS}
+            campos["feature_names_in_"] = campos["feature_names_in_"].astype(object)
+            floresta = cls(**campos)
+            floresta.origem = str(dados["origem"]) if "origem" in dados.files else None
+            return floresta
+
+    @staticmethod
+    def origem_de(caminho):
+        """sha1 do .pkl de onde o .npz foi exportado (None em arquivos antigos), sem ler as árvores."""
+        with np.load(caminho, allow_pickle=False) as dados:
+            return str(dados["origem"]) if "origem" in dados.files else None
+
+
+def main(argv):
+    import joblib
+
+    from backend.registry import hash_conteudo
+
+    origem = argv[1] if len(argv) >= 2 else "models/modelo_rf.pkl"
+    destino = argv[2] if len(argv) >= 3 else ARQUIVO_PLANO
+    rf = joblib.load(origem)
+    floresta = FlorestaPlana.de_sklearn(rf)
+    floresta.origem = hash_conteudo(origem)
+    floresta.salvar(destino)
+    print(f"{len(floresta.raizes)} árvores, {len(floresta.feature)} nós -> {destino}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
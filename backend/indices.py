@@ -0,0 +1,169 @@
+# índices pré-agregados sobre o dataset de ocorrências, montados uma vez na carga dos dados
+
+import numpy as np
+import pandas as pd
+
+from eventos import EVENTOS, processar_eventos, marcar_eventos
+
+
+def _dias(datas):
+    """(dias distintos ordenados, índice do dia de cada linha válida, máscara das linhas válidas)."""
+    datas = pd.to_datetime(pd.Series(datas).reset_index(drop=True), errors="coerce")
+    validas = datas.notna().to_numpy()
+    dias_linha = datas[validas].to_numpy().astype("datetime64[D]")
+    dias, dia_idx = np.unique(dias_linha, return_inverse=True)
+    return dias, dia_idx, validas
+
+
+def _codigos(valores, validas):
+    """Códigos das categorias; valores ausentes vão para o último código (coluna extra)."""
+    valores = pd.Series(valores).reset_index(drop=True)[validas]
+    codigos, categorias = pd.factorize(valores, sort=False)
+    categorias = [str(c) for c in categorias]
+    return np.where(codigos < 0, len(categorias), codigos), categorias
+
+
+def _intervalo(dias, data_inicio, data_fim):
+    # None em qualquer ponta = sem limite daquele lado
+    lo = 0 if data_inicio is None else np.searchsorted(dias, np.datetime64(data_inicio, "D"), side="left")
+    hi = len(dias) if data_fim is None else np.searchsorted(dias, np.datetime64(data_fim, "D"), side="right")
+    return lo, max(lo, hi)
+
+
+def _primeiras(chaves, tamanho):
+    """Posição da primeira linha (na ordem do arquivo) de cada chave; chaves sem linha ficam no fim."""
+    primeiras = np.full(tamanho, np.iinfo(np.int64).max, dtype=np.int64)
+    unicas, posicoes = np.unique(chaves, return_index=True)
+    primeiras[unicas] = posicoes
+    return primeiras
+
+
+def _ordenar(contagens, categorias, n=None, primeiras=None):
+    # mesma ordem do value_counts sobre as linhas da janela: mais frequentes primeiro, empates na
+    # ordem de aparição dentro da janela (primeiras: posição da primeira linha da janela por categoria)
+    ordem = np.lexsort((primeiras, -contagens))[:n]
+    return {categorias[i]: int(contagens[i]) for i in ordem if contagens[i] > 0}
+
+
+class CuboDiario:
+    """Contagem de ocorrências por dia x categoria, com somas acumuladas ao longo dos dias.
+
+    A contagem de um intervalo de datas é a diferença entre duas linhas da soma acumulada,
+    localizadas por busca binária no vetor de dias (ordenado).
+    """
+
+    def __init__(self, datas, valores):
+        self.dias, dia_idx, validas = _dias(datas)
+        codigos, self.categorias = _codigos(valores, validas)
+
+        # valores ausentes ficam numa coluna extra: contam no total, mas não aparecem como categoria
+        n_cat = len(self.categorias) + 1
+        chaves = dia_idx * n_cat + codigos
+        contagens = np.bincount(chaves, minlength=len(self.dias) * n_cat)
+        self.diarias = contagens.reshape(len(self.dias), n_cat)
+        # primeira linha de cada dia x categoria: desempata o top pela ordem de aparição na janela
+        self.primeiras = _primeiras(chaves, len(self.dias) * n_cat).reshape(len(self.dias), n_cat)
+
+        self.acumulado = np.zeros((len(self.dias) + 1, n_cat), dtype=np.int64)
+        np.cumsum(self.diarias, axis=0, out=self.acumulado[1:])
+
+    def intervalo(self, data_inicio, data_fim):
+        """Posições [lo, hi) no vetor de dias para data_inicio <= dia <= data_fim."""
+        return _intervalo(self.dias, data_inicio, data_fim)
+
+    def contar(self, data_inicio, data_fim):
+        """(total de ocorrências, contagem por categoria) no intervalo fechado de datas."""
+        lo, hi = self.intervalo(data_inicio, data_fim)
+        contagens = self.acumulado[hi] - self.acumulado[lo]
+        return int(contagens.sum()), contagens[:-1]
+
+    def top(self, data_inicio, data_fim, n=10):
+        lo, hi = self.intervalo(data_inicio, data_fim)
+        contagens = self.acumulado[hi] - self.acumulado[lo]
+        primeiras = self.primeiras[lo:hi, :-1].min(axis=0, initial=np.iinfo(np.int64).max)
+        return int(contagens.sum()), _ordenar(contagens[:-1], self.categorias, n, primeiras)
+
+    def serie(self, data_inicio, data_fim, freq="D", categoria=None):
+        """Ocorrências por dia ("D") ou mês ("M") no intervalo, só dos períodos com ocorrência."""
+        lo, hi = self.intervalo(data_inicio, data_fim)
+        if categoria is None:
+            por_dia = self.diarias[lo:hi].sum(axis=1)
+        elif categoria in self.categorias:
+            por_dia = self.diarias[lo:hi, self.categorias.index(categoria)]
+        else:
+            return {}
+        periodos = self.dias[lo:hi].astype(f"datetime64[{freq}]")
+        chaves, inverso = np.unique(periodos, return_inverse=True)
+        contagens = np.bincount(inverso, weights=por_dia, minlength=len(chaves)).astype(np.int64)
+        return {str(k): int(c) for k, c in zip(chaves, contagens) if c > 0}
+
+    def por_dia_do_mes(self, mes):
+        """Ocorrências por dia do mês x categoria, somando todos os anos do mês escolhido."""
+        dias = self.dias
+        meses = dias.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        sel = meses == mes
+        dia_do_mes = (dias[sel] - dias[sel].astype("datetime64[M]")).astype(np.int64) + 1
+        tabela = np.zeros((32, len(self.categorias)), dtype=np.int64)
+        np.add.at(tabela, dia_do_mes, self.diarias[sel, :-1])
+        return tabela[1:]
+
+
+class CuboCruzado:
+    """Contagem acumulada por dia x linha x coluna (ex.: bairro x tipo_crime)."""
+
+    def __init__(self, datas, linhas, colunas):
+        self.dias, dia_idx, validas = _dias(datas)
+        cod_lin, self.linhas = _codigos(linhas, validas)
+        cod_col, self.colunas = _codigos(colunas, validas)
+
+        n_lin, n_col = len(self.linhas) + 1, len(self.colunas) + 1
+        plano = (dia_idx * n_lin + cod_lin) * n_col + cod_col
+        contagens = np.bincount(plano, minlength=len(self.dias) * n_lin * n_col)
+        contagens = contagens.reshape(len(self.dias), n_lin, n_col)
+        self.primeiras = _primeiras(plano, len(self.dias) * n_lin * n_col).reshape(len(self.dias), n_lin, n_col)
+
+        self.acumulado = np.zeros((len(self.dias) + 1, n_lin, n_col), dtype=np.int64)
+        np.cumsum(contagens, axis=0, out=self.acumulado[1:])
+
+    def contar(self, data_inicio, data_fim):
+        """Matriz linha x coluna de contagens no intervalo fechado de datas."""
+        lo, hi = _intervalo(self.dias, data_inicio, data_fim)
+        return (self.acumulado[hi] - self.acumulado[lo])[:-1, :-1]
+
+    def mix(self, data_inicio, data_fim, linha=None):
+        """{linha: {coluna: contagem}} com as colunas em ordem decrescente."""
+        lo, hi = _intervalo(self.dias, data_inicio, data_fim)
+        matriz = (self.acumulado[hi] - self.acumulado[lo])[:-1, :-1]
+        primeiras = self.primeiras[lo:hi, :-1, :-1].min(axis=0, initial=np.iinfo(np.int64).max)
+        return {
+            nome: _ordenar(matriz[i], self.colunas, primeiras=primeiras[i])
+            for i, nome in enumerate(self.linhas)
+            if (linha is None or nome == linha) and matriz[i].any()
+        }
+
+
+# dimensões aceitas pelo /insight/contagem -> coluna do dataset
+DIMENSOES = {
+    "bairro": "bairro",
+    "tipo_crime": "tipo_crime",
+    "arma": "arma_utilizada",
+    "status": "status_investigacao",
+    "evento": "evento_especial",
+}
+
+
+class IndiceOcorrencias:
+    """Todos os cubos do /insight, montados a partir de um único DataFrame de ocorrências."""
+
+    COLUNAS = ["data_ocorrencia", "bairro", "tipo_crime", "arma_utilizada", "status_investigacao"]
+
+    def __init__(self, df):
+        df = df.copy()
+        df["evento_especial"] = marcar_eventos(df["data_ocorrencia"], processar_eventos(EVENTOS, margem=5))
+        datas = df["data_ocorrencia"]
+        self.cubos = {dim: CuboDiario(datas, df[coluna]) for dim, coluna in DIMENSOES.items()}
+        self.bairro_crime = CuboCruzado(datas, df["bairro"], df["tipo_crime"])
+
+    @classmethod
+    def de_csv(cls, caminho):
+        return cls(pd.read_csv(caminho, usecols=cls.COLUNAS))
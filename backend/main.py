@@ -1,12 +1,30 @@
 #aqui é o app principal onde todos os roteadores serão incluídos.
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from backend.routers import predict, insights
+from backend.metricas import MiddlewareMetricas, RespostaJSON
+from backend.registry import registro
+from backend.routers import predict, insights, spatial, health
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # modelos e datasets já foram carregados no import dos roteadores; aqui só vigia os arquivos
+    registro.iniciar()
+    yield
+    await predict.agrupador.fechar()
+    registro.parar()
+
 
-app = FastAPI()
+# RespostaJSON separa o tempo de serialização; o middleware mede cada requisição por rota
+app = FastAPI(lifespan=lifespan, default_response_class=RespostaJSON)
+app.add_middleware(MiddlewareMetricas)
 
 app.include_router(predict.router)
 app.include_router(insights.router)
+app.include_router(spatial.router)
+app.include_router(health.router)
 
 @app.get("/")
 async def root():
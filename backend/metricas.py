@@ -0,0 +1,147 @@
+# métricas de desempenho da API, mantidas em memória por worker
+#
+# O middleware é ASGI puro (sem BaseHTTPMiddleware, que cria uma task e filas por requisição):
+# por requisição são duas leituras de relógio, uma busca em dicionário e um bisect nos limites
+# do histograma. As rotas são identificadas pelo molde ("/spatial/raio"), não pela URL, então o
+# número de séries é fixo. Etapas internas (inferência, serialização) usam os mesmos histogramas.
+
+from bisect import bisect_left
+import threading
+import time
+
+from fastapi.responses import JSONResponse
+
+# limites superiores dos baldes, em ms; o último balde é "acima de 10 s"
+LIMITES_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10000)
+
+
+class Histograma:
+    """Contagem por balde de latência, com soma para a média."""
+
+    __slots__ = ("baldes", "contagem", "soma_ms", "maximo_ms")
+
+    def __init__(self):
+        self.baldes = [0] * (len(LIMITES_MS) + 1)
+        self.contagem = 0
+        self.soma_ms = 0.0
+        self.maximo_ms = 0.0
+
+    def observar(self, ms):
+        self.baldes[bisect_left(LIMITES_MS, ms)] += 1
+        self.contagem += 1
+        self.soma_ms += ms
+        if ms > self.maximo_ms:
+            self.maximo_ms = ms
+
+    def percentil(self, q):
+        # limite superior do balde onde cai o percentil (estimativa por excesso)
+        if not self.contagem:
+            return None
+        alvo = q * self.contagem
+        acumulado = 0
+        for limite, n in zip(LIMITES_MS, self.baldes):
+            acumulado += n
+            if acumulado >= alvo:
+                return limite
+        return self.maximo_ms
+
+    def resumo(self):
+        acumulado, baldes = 0, {}
+        for limite, n in zip(LIMITES_MS, self.baldes):
+            acumulado += n
+            baldes[f"<={limite}"] = acumulado
+        baldes["+inf"] = self.contagem
+        return {
+            "contagem": self.contagem,
+            "media_ms": round(self.soma_ms / self.contagem, 3) if self.contagem else None,
+            "p50_ms": self.percentil(0.5),
+            "p99_ms": self.percentil(0.99),
+            "max_ms": round(self.maximo_ms, 3),
+            "baldes_ms": baldes,
+        }
+
+
+class Metricas:
+    """Requisições por rota, requisições em andamento e tempo das etapas internas."""
+
+    def __init__(self):
+        self.inicio = time.time()
+        self.em_andamento = 0
+        self.rotas = {}
+        self.etapas = {}
+        # etapas são observadas também de threads (predict_proba roda em asyncio.to_thread)
+        self._lock = threading.Lock()
+
+    def observar_rota(self, rota, status, ms):
+        serie = self.rotas.get(rota)
+        if serie is None:
+            serie = self.rotas[rota] = {"latencia": Histograma(), "status": {}}
+        serie["latencia"].observar(ms)
+        classe = f"{status // 100}xx"
+        serie["status"][classe] = serie["status"].get(classe, 0) + 1
+
+    def observar_etapa(self, etapa, ms):
+        with self._lock:
+            histograma = self.etapas.get(etapa)
+            if histograma is None:
+                histograma = self.etapas[etapa] = Histograma()
+            histograma.observar(ms)
+
+    def resumo(self):
+        with self._lock:
+            etapas = {nome: h.resumo() for nome, h in self.etapas.items()}
+        rotas = {
+            rota: {"status": dict(serie["status"]), **serie["latencia"].resumo()}
+            for rota, serie in list(self.rotas.items())
+        }
+        return {
+            "desde": self.inicio,
+            "em_andamento": self.em_andamento,
+            "rotas": rotas,
+            "etapas": etapas,
+        }
+
+
+metricas = Metricas()
+
+
+class MiddlewareMetricas:
+    """Mede do recebimento ao último byte da resposta de cada requisição HTTP."""
+
+    def __init__(self, app, metricas=metricas):
+        self.app = app
+        self.metricas = metricas
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def enviar(mensagem):
+            nonlocal status
+            if mensagem["type"] == "http.response.start":
+                status = mensagem["status"]
+            await send(mensagem)
+
+        self.metricas.em_andamento += 1
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            ms = (time.perf_counter() - t0) * 1000
+            self.metricas.em_andamento -= 1
+            # o roteador grava a rota encontrada no próprio scope; sem rota é 404/405
+            rota = scope.get("route")
+            nome = f"{scope['method']} {rota.path}" if rota is not None else "sem rota"
+            self.metricas.observar_rota(nome, status, ms)
+
+
+class RespostaJSON(JSONResponse):
+    """JSONResponse que registra o tempo de serialização na etapa "serializacao"."""
+
+    def render(self, content):
+        t0 = time.perf_counter()
+        corpo = super().render(content)
+        metricas.observar_etapa("serializacao", (time.perf_counter() - t0) * 1000)
+        return corpo
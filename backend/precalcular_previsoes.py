@@ -0,0 +1,84 @@
+# job que pré-calcula as previsões do /predict/ para um horizonte de dias
+#
+# As features do modelo dependem só da data, de is_event, do bairro e da idade do suspeito
+# (que o dashboard não envia, ficando no default). Para os próximos N dias o espaço de
+# consultas é pequeno: este job pontua toda combinação (data, bairro, is_event) e grava
+# as probabilidades num .npy que o roteador abre com mmap.
+#
+# Uso (na raiz do repositório):
+#     python -m backend.precalcular_previsoes [--dias 90] [--inicio AAAA-MM-DD]
+
+from datetime import date, timedelta
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from backend.registry import registro
+from backend.routers import predict
+
+
+def gerar_tabela(inicio, dias, destino=predict.ARQUIVO_TABELA):
+    recurso = registro.recurso("modelos")
+    if not recurso.carregado:
+        raise SystemExit(f"Modelos indisponíveis: {recurso.erro}")
+    m = recurso.valor
+
+    idade = predict.Ocorrencia.model_fields["idade_suspeito"].default
+    bairros = list(m.bairro_codigos)
+    ocorrencias = [
+        predict.Ocorrencia(
+            data_ocorrencia=(inicio + timedelta(days=d)).isoformat(),
+            bairro=bairro,
+            is_event=evento,
+            idade_suspeito=idade,
+        )
+        for d in range(dias)
+        for bairro in bairros
+        for evento in (0, 1)
+    ]
+    probs = m.rf_model.predict_proba(predict.montar_matriz(m, ocorrencias))
+
+    # grava em arquivos temporários e troca no fim, para o roteador nunca ler um arquivo pela metade
+    tmp = destino + ".tmp"
+    arr = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float64,
+                                    shape=(dias, len(bairros), 2, probs.shape[1]))
+    arr[:] = probs.reshape(arr.shape)
+    arr.flush()
+    del arr
+
+    # o .npy entra primeiro; o .json descreve exatamente esse arquivo (tamanho e data de
+    # modificação), e o roteador recusa o par enquanto o .json antigo ainda estiver no lugar
+    os.replace(tmp, destino)
+    meta = {
+        "versao_modelo": recurso.versao,
+        "inicio": inicio.isoformat(),
+        "dias": dias,
+        "idade_suspeito": idade,
+        "bairros": bairros,
+        "classes": m.classes_crime,
+        "arquivo": predict.assinatura_tabela(destino),
+    }
+    meta_path = destino[: -len(".npy")] + ".json"
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(meta_path + ".tmp", meta_path)
+    return len(ocorrencias)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pré-calcula a tabela de previsões do /predict/")
+    parser.add_argument("--dias", type=int, default=90)
+    parser.add_argument("--inicio", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--destino", default=predict.ARQUIVO_TABELA)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    n = gerar_tabela(args.inicio, args.dias, args.destino)
+    print(f"{n} combinações gravadas em {args.destino} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
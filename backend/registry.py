@@ -0,0 +1,173 @@
+# registro compartilhado de dados e modelos do backend
+#
+# Cada recurso (modelos, datasets, tabelas) é carregado uma vez e fica em memória.
+# Uma thread em segundo plano compara tamanho/data de modificação dos arquivos e, se algo
+# mudou, carrega a nova versão por fora e só então troca a referência do recurso. Quem está
+# atendendo uma requisição continua com o objeto antigo até terminar: não há leitura de
+# estado pela metade nem requisição esperando a recarga.
+#
+# Cada worker tem o seu registro; as cargas são impressas com o pid para comparar os workers.
+# Recurso obrigatório sem valor (falha na primeira carga) deixa o processo fora de pronto().
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+import hashlib
+import os
+import threading
+import time
+
+
+def assinatura_arquivos(caminhos):
+    """(caminho, tamanho, mtime) de cada arquivo; None para arquivos ausentes."""
+    assinatura = []
+    for caminho in sorted(caminhos):
+        try:
+            st = os.stat(caminho)
+            assinatura.append((caminho, st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            assinatura.append((caminho, None, None))
+    return tuple(assinatura)
+
+
+def versao_de(assinatura):
+    return hashlib.sha1(repr(assinatura).encode()).hexdigest()[:12]
+
+
+_hashes = {}
+
+
+def hash_conteudo(caminho):
+    """sha1 do conteúdo do arquivo (memorizado por caminho, tamanho e data de modificação)."""
+    st = os.stat(caminho)
+    chave = (os.path.abspath(caminho), st.st_size, st.st_mtime_ns)
+    if chave not in _hashes:
+        h = hashlib.sha1()
+        with open(caminho, "rb") as f:
+            for bloco in iter(lambda: f.read(1 << 20), b""):
+                h.update(bloco)
+        _hashes[chave] = h.hexdigest()
+    return _hashes[chave]
+
+
+@dataclass(frozen=True)
+class Recurso:
+    nome: str
+    valor: Any = None
+    versao: Optional[str] = None
+    carregado_em: Optional[float] = None
+    duracao_s: Optional[float] = None
+    erro: Optional[str] = None
+    assinatura: tuple = field(default=(), repr=False)
+
+    @property
+    def carregado(self):
+        return self.valor is not None
+
+
+@dataclass
+class _Fonte:
+    caminhos: tuple
+    carregar: Callable[[], Any]
+    ao_trocar: Optional[Callable[[Recurso], None]] = None
+    obrigatorio: bool = True
+    versao: Optional[Callable[[Any], str]] = None
+
+
+class Registro:
+    """Recursos carregados uma vez, recarregados atomicamente quando os arquivos mudam."""
+
+    def __init__(self, intervalo=5.0):
+        self.intervalo = intervalo
+        self._fontes = {}
+        self._recursos = {}
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def registrar(self, nome, caminhos, carregar, ao_trocar=None, obrigatorio=True, versao=None):
+        """Registra e carrega o recurso na hora (erros ficam registrados em Recurso.erro).
+
+        versao(valor) dá a versão do recurso carregado; sem ela, a versão vem de caminho,
+        tamanho e data de modificação dos arquivos.
+        """
+        self._fontes[nome] = _Fonte(tuple(caminhos), carregar, ao_trocar, obrigatorio, versao)
+        self._recarregar(nome)
+
+    def recurso(self, nome) -> Recurso:
+        # leitura sem lock: a troca do dicionário inteiro é atômica
+        return self._recursos.get(nome) or Recurso(nome, erro="não registrado")
+
+    def valor(self, nome):
+        return self.recurso(nome).valor
+
+    def status(self):
+        return {nome: self.recurso(nome) for nome in self._fontes}
+
+    def pendencias(self):
+        """Recursos obrigatórios sem valor carregado, com o motivo."""
+        return {nome: self.recurso(nome).erro or "não carregado"
+                for nome, fonte in self._fontes.items()
+                if fonte.obrigatorio and not self.recurso(nome).carregado}
+
+    def avisos(self):
+        """Erros de carga que não tiram o processo de pronto (recursos opcionais ou versão anterior em uso)."""
+        pendencias = self.pendencias()
+        return {nome: r.erro for nome, r in self.status().items() if r.erro and nome not in pendencias}
+
+    def pronto(self):
+        return not self.pendencias()
+
+    def _recarregar(self, nome):
+        fonte = self._fontes[nome]
+        anterior = self._recursos.get(nome)
+        assinatura = assinatura_arquivos(fonte.caminhos)
+        t0 = time.perf_counter()
+        try:
+            valor = fonte.carregar()
+        except Exception as e:
+            print(f"[pid {os.getpid()}] erro ao carregar {nome}: {e}")
+            # mantém a versão anterior em uso e registra o erro
+            base = anterior or Recurso(nome)
+            novo = Recurso(nome, base.valor, base.versao, base.carregado_em, base.duracao_s,
+                           f"{type(e).__name__}: {e}", assinatura)
+            self._trocar(nome, novo)
+            return novo
+        versao = fonte.versao(valor) if fonte.versao is not None else versao_de(assinatura)
+        novo = Recurso(nome, valor, versao, time.time(), time.perf_counter() - t0, None, assinatura)
+        acao = "recarregado" if anterior is not None and anterior.carregado else "carregado"
+        print(f"[pid {os.getpid()}] {nome} {novo.versao} {acao} em {novo.duracao_s * 1000:.0f} ms")
+        self._trocar(nome, novo)
+        if fonte.ao_trocar is not None:
+            fonte.ao_trocar(novo)
+        return novo
+
+    def _trocar(self, nome, recurso):
+        with self._lock:
+            recursos = dict(self._recursos)
+            recursos[nome] = recurso
+            self._recursos = recursos
+
+    def verificar(self):
+        """Recarrega os recursos cujos arquivos mudaram desde a última carga."""
+        for nome, fonte in list(self._fontes.items()):
+            atual = self._recursos.get(nome)
+            if atual is None or assinatura_arquivos(fonte.caminhos) != atual.assinatura:
+                self._recarregar(nome)
+
+    def _vigiar(self):
+        while not self._parar.wait(self.intervalo):
+            self.verificar()
+
+    def iniciar(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._parar.clear()
+            self._thread = threading.Thread(target=self._vigiar, name="registro-recarga", daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.intervalo + 1)
+
+
+registro = Registro(intervalo=float(os.getenv("REGISTRO_INTERVALO", "5")))
@@ -1 +1,46 @@
-# esse arquivo será responsável pelos endpoints referentes a health checks
\ No newline at end of file
+# esse arquivo será responsável pelos endpoints referentes a health checks
+
+import os
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from backend.metricas import metricas
+from backend.registry import registro
+from backend.routers import predict
+
+router = APIRouter(prefix="/health")
+
+
+def _recursos():
+    return {
+        nome: {
+            "carregado": recurso.carregado,
+            "versao": recurso.versao,
+            "carregado_em": recurso.carregado_em,
+            "duracao_ms": round(recurso.duracao_s * 1000, 1) if recurso.duracao_s is not None else None,
+            "erro": recurso.erro,
+        }
+        for nome, recurso in registro.status().items()
+    }
+
+
+@router.get("/live")
+async def live():
+    """O processo está de pé e o event loop responde; não olha modelos nem dados."""
+    return {"vivo": True, "pid": os.getpid(), "uptime_s": round(time.time() - metricas.inicio, 1)}
+
+
+@router.get("/ready")
+async def ready():
+    """200 quando todos os recursos obrigatórios estão carregados; 503 com os erros, caso contrário."""
+    pendencias = registro.pendencias()
+    return JSONResponse({"pronto": not pendencias, "pendencias": pendencias, "avisos": registro.avisos(),
+                         "recursos": _recursos()},
+                        status_code=503 if pendencias else 200)
+
+
+@router.get("/metrics")
+async def metrics():
+    return {"pid": os.getpid(), **metricas.resumo(), "agrupamento": predict.agrupador.stats()}
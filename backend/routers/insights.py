@@ -1,35 +1,88 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import joblib
 import pandas as pd
 import numpy as np
 from datetime import date, timedelta
-from typing import Optional
+from typing import Literal, Optional
 import uvicorn
 
+from backend.indices import DIMENSOES, IndiceOcorrencias
+from backend.registry import registro
+
 router = APIRouter(prefix="/insight")
 
+ARQUIVO_OCORRENCIAS = "dataset_ocorrencias_delegacia.csv"
+
+# o dataset é lido uma única vez e resumido em cubos de contagem (dia x dimensão)
+registro.registrar("ocorrencias", [ARQUIVO_OCORRENCIAS], lambda: IndiceOcorrencias.de_csv(ARQUIVO_OCORRENCIAS))
+
+
+def indice_atual():
+    indice = registro.valor("ocorrencias")
+    if indice is None:
+        raise HTTPException(status_code=503, detail="Dataset principal não encontrado.")
+    return indice
+
+
+def _dimensao(nome):
+    if nome not in DIMENSOES:
+        raise HTTPException(status_code=422, detail=f"Dimensão inválida: {nome} (use {', '.join(DIMENSOES)})")
+    return nome
+
 @router.get("/")
 async def get_insights(data_inicio: Optional[date] = date.today() - timedelta(days=30), data_fim: Optional[date] = date.today()):
     
-    try:
-        df = pd.read_csv("dataset_ocorrencias_delegacia.csv")
-        df["data_ocorrencia"] = pd.to_datetime(df["data_ocorrencia"], errors='coerce')
-        df.dropna(subset=['data_ocorrencia'], inplace=True)
-    except FileNotFoundError:
+    indice = registro.valor("ocorrencias")
+    if indice is None:
         return {"error": "Dataset principal não encontrado."}
-    
-    df_filtrado = df.copy()
 
-    df_filtrado = df_filtrado[df_filtrado['data_ocorrencia'].dt.date >= data_inicio]
-    df_filtrado = df_filtrado[df_filtrado['data_ocorrencia'].dt.date <= data_fim]
+    total, top_crimes = indice.cubos["tipo_crime"].top(data_inicio, data_fim, 10)
 
-    if df_filtrado.empty:
+    if total == 0:
         return {"message": f"Nenhuma ocorrência encontrada para o período selecionado ({data_inicio} - {data_fim})"}
-    
-    top_crimes = df_filtrado['tipo_crime'].value_counts().head(10).to_dict()
 
+    return {"top_crimes":top_crimes}
 
 
-    return {"top_crimes":top_crimes}
+# sem data_inicio/data_fim os endpoints abaixo usam todo o histórico
+
+@router.get("/contagem")
+async def contagem(por: str = "tipo_crime", data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                   limite: Optional[int] = None):
+    """Ocorrências agrupadas por bairro, tipo_crime, arma, status ou evento (mais frequentes primeiro)."""
+    total, contagens = indice_atual().cubos[_dimensao(por)].top(data_inicio, data_fim, limite)
+    return {"por": por, "total": total, "contagens": contagens}
+
+
+@router.get("/serie")
+async def serie(freq: Literal["mensal", "diaria"] = "mensal", data_inicio: Optional[date] = None,
+                data_fim: Optional[date] = None, por: Optional[str] = None, valor: Optional[str] = None):
+    """Série temporal de ocorrências; com por/valor, só das ocorrências daquela categoria."""
+    cubo = indice_atual().cubos[_dimensao(por or "tipo_crime")]
+    pontos = cubo.serie(data_inicio, data_fim, "M" if freq == "mensal" else "D", valor if por else None)
+    return {"freq": freq, "serie": pontos}
+
+
+@router.get("/mix")
+async def mix(bairro: Optional[str] = None, data_inicio: Optional[date] = None, data_fim: Optional[date] = None):
+    """Distribuição de tipo_crime dentro de cada bairro (ou de um bairro)."""
+    return {"bairros": indice_atual().bairro_crime.mix(data_inicio, data_fim, bairro)}
+
 
+@router.get("/mensal")
+async def mensal(mes: int):
+    """Ocorrências por dia do mês x tipo_crime, somando todos os anos do mês escolhido."""
+    if not 1 <= mes <= 12:
+        raise HTTPException(status_code=422, detail="mes deve estar entre 1 e 12")
+    cubo = indice_atual().cubos["tipo_crime"]
+    tabela = cubo.por_dia_do_mes(mes)
+    # crimes do mais comum para o menos comum dentro do mês
+    ordem = np.argsort(-tabela.sum(axis=0), kind="stable")
+    return {
+        "mes": mes,
+        "crimes": {
+            cubo.categorias[j]: {str(d + 1): int(v) for d, v in enumerate(tabela[:, j]) if v}
+            for j in ordem if tabela[:, j].any()
+        },
+    }
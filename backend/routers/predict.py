@@ -1,52 +1,283 @@
 # esse arquivo será responsável pelos endpoints referentes às predições adicionadas via post
 
-from fastapi import APIRouter
-from pydantic import BaseModel
-import joblib
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, field_validator
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from datetime import datetime, date
+from typing import List
+from sklearn.impute import SimpleImputer
+import warnings
+import asyncio
+import json
+import os
+import time
 import uvicorn
 
-try:
-    imputer = joblib.load("models/imputer_idade.pkl")
-    rf_model = joblib.load("models/modelo_rf.pkl")
-    le_bairro = joblib.load("models/encoder_bairro.pkl")
-    le_crime = joblib.load("models/encoder_crime.pkl")
-except Exception as e:
-    print(f"Erro ao carregar modelos: {e}")
+from backend.batching import Agrupador
+from backend.cache import TTLCache
+from backend.artefatos import arquivos_monitorados, carregar, resolver_modelos
+from backend.metricas import metricas
+from backend.registry import registro
+
+# ordem das features usada no treino do modelo
+FEATURES = ["ano", "mes", "dia_da_semana", "is_event", "bairro", "idade_suspeito"]
+
+# motor de inferência da floresta: "sklearn" (modelo_rf.pkl) ou "plano" (vetores exportados por
+# python -m backend.forest, sem os objetos de árvore do sklearn em memória)
+MOTOR = os.getenv("PREDICT_ENGINE", "sklearn")
+
+# artefatos exportados por python -m backend.artefatos (models/mmap/) têm preferência sobre os
+# .pkl; a escolha e a versão (hash do conteúdo dos .pkl de origem) são refeitas a cada carga
+ARQUIVOS_MODELO = arquivos_monitorados(MOTOR)
+
+# tabela pré-calculada (data x bairro x is_event) e seus metadados (.json ao lado)
+ARQUIVO_TABELA = "models/tabela_previsoes.npy"
+
+# cache de predições: chave = (versão dos modelos, features da linha)
+cache_predicoes = TTLCache(
+    maxsize=int(os.getenv("PREDICT_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("PREDICT_CACHE_TTL", "300")),
+)
+
+
+def imputer_sem_efeito(imputer):
+    if not isinstance(imputer, SimpleImputer) or getattr(imputer, "add_indicator", False):
+        return False
+    faltante = imputer.missing_values
+    return isinstance(faltante, float) and np.isnan(faltante)
+
+
+class ModelosPredicao:
+    """Modelos do /predict/ e as tabelas derivadas deles para o caminho rápido."""
+
+    def __init__(self, imputer, rf_model, le_bairro, le_crime):
+        self.imputer = imputer
+        self.rf_model = rf_model
+        self.le_bairro = le_bairro
+        self.le_crime = le_crime
+
+        # bairro -> código e nomes das classes já decodificados
+        self.bairro_codigos = {str(b): i for i, b in enumerate(le_bairro.classes_)}
+        self.classes_crime = [str(c) for c in le_crime.inverse_transform(np.arange(len(rf_model.classes_)))]
+        self.ordem_features = list(getattr(rf_model, "feature_names_in_", FEATURES))
+        self.col = {nome: self.ordem_features.index(nome) for nome in FEATURES}
+        # idade_suspeito sempre chega preenchida (int com default, nunca NaN): um SimpleImputer que
+        # só troca NaN e não acrescenta colunas indicadoras não altera o valor e pode ser pulado
+        self.imputer_identidade = imputer_sem_efeito(imputer)
+
+
+def carregar_modelos():
+    caminhos, versao = resolver_modelos(MOTOR)
+    m = ModelosPredicao(
+        carregar(caminhos["imputer"]),
+        carregar(caminhos["rf_model"]),
+        carregar(caminhos["le_bairro"]),
+        carregar(caminhos["le_crime"]),
+    )
+    m.caminhos, m.versao = caminhos, versao
+    return m
+
+
+def assinatura_tabela(caminho):
+    st = os.stat(caminho)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def carregar_tabela(caminho=ARQUIVO_TABELA):
+    # tabela gerada por backend/precalcular_previsoes.py. Qualquer problema vira erro do recurso
+    # (visível em /health/ready); se havia uma tabela coerente carregada, o registro a mantém e a
+    # versão dos modelos ainda é conferida a cada consulta
+    meta_path = caminho[: -len(".npy")] + ".json"
+    if not (os.path.exists(caminho) and os.path.exists(meta_path)):
+        raise FileNotFoundError(f"{caminho} não gerada (python -m backend.precalcular_previsoes)")
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    probs = np.load(caminho, mmap_mode="r")
+    # .npy e .json são trocados em dois passos: se o par não for o mesmo (troca no meio), a
+    # tabela é recusada até a próxima verificação do registro, que vê o .json novo
+    formato = (meta["dias"], len(meta["bairros"]), 2, len(meta["classes"]))
+    if meta.get("arquivo") != assinatura_tabela(caminho) or probs.shape != formato:
+        raise ValueError(f"{caminho} não corresponde a {meta_path}")
+    versao_modelos = registro.recurso("modelos").versao
+    if meta["versao_modelo"] != versao_modelos:
+        raise ValueError(f"tabela gerada para os modelos {meta['versao_modelo']}, carregados {versao_modelos}; "
+                         "regenere com python -m backend.precalcular_previsoes")
+    meta["probs"] = probs
+    meta["inicio"] = date.fromisoformat(meta["inicio"])
+    return meta
+
+
+_versao_em_cache = None
+
+
+def _modelos_trocados(recurso):
+    # as chaves do cache já levam a versão; só libera a memória quando os modelos mudaram de fato
+    # (arquivos regravados ou reexportados com o mesmo conteúdo mantêm a versão)
+    global _versao_em_cache
+    if recurso.versao != _versao_em_cache:
+        cache_predicoes.clear()
+        _versao_em_cache = recurso.versao
+
+
+registro.registrar("modelos", ARQUIVOS_MODELO, carregar_modelos, ao_trocar=_modelos_trocados,
+                   versao=lambda m: m.versao)
+# a tabela é opcional: sem ela o /predict/ cai no predict_proba e o worker continua pronto. Ela
+# também vigia os arquivos dos modelos (registrados antes, logo recarregados antes): quando a
+# versão dos modelos muda, a tabela é conferida de novo
+registro.registrar("tabela_previsoes", [ARQUIVO_TABELA, ARQUIVO_TABELA[: -len(".npy")] + ".json", *ARQUIVOS_MODELO],
+                   carregar_tabela, obrigatorio=False)
+
+# a matriz é montada em NumPy na ordem do treino; o aviso de "feature names" do sklearn não se aplica
+warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
 
 router = APIRouter(prefix="/predict")
 
+# limite de ocorrências por chamada de /predict/batch
+MAX_LOTE = 50_000
+
+def _parse_data(texto):
+    try:
+        return date.fromisoformat(texto)
+    except ValueError:
+        return datetime.strptime(texto, "%Y-%m-%d").date()
+
+
 class Ocorrencia(BaseModel):
     data_ocorrencia: str
     bairro: str
     is_event: int
     idade_suspeito: int = 30
 
+    # data inválida (ex.: 2024-02-30) vira 422 na validação, antes de entrar num lote
+    @field_validator("data_ocorrencia")
+    @classmethod
+    def _data_valida(cls, valor):
+        _parse_data(valor)
+        return valor
+
+
+
+def montar_matriz(m, ocorrencias):
+    # preenche direto uma matriz NumPy pré-alocada, sem DataFrame nem LabelEncoder.transform
+    col = m.col
+    X = np.empty((len(ocorrencias), len(m.ordem_features)), dtype=np.float64)
+    for i, ocorrencia in enumerate(ocorrencias):
+        data_dt = _parse_data(ocorrencia.data_ocorrencia)
+        codigo = m.bairro_codigos.get(ocorrencia.bairro)
+        if codigo is None:
+            raise HTTPException(status_code=422, detail=f"Bairro desconhecido: {ocorrencia.bairro}")
+        X[i, col["ano"]] = data_dt.year
+        X[i, col["mes"]] = data_dt.month
+        X[i, col["dia_da_semana"]] = data_dt.weekday()
+        X[i, col["is_event"]] = ocorrencia.is_event
+        X[i, col["bairro"]] = codigo
+        X[i, col["idade_suspeito"]] = ocorrencia.idade_suspeito
+
+    if not m.imputer_identidade:
+        idade = pd.DataFrame({"idade_suspeito": X[:, col["idade_suspeito"]]})
+        X[:, col["idade_suspeito"]] = m.imputer.transform(idade).ravel()
+
+    return X
+
+
+def formatar_predicoes(m, probs):
+    # ordena cada linha por probabilidade decrescente (estável, como o sorted original)
+    ordem = np.argsort(-probs, axis=1, kind="stable")
+    return [
+        [{"tipo_crime": m.classes_crime[j], "prob": float(linha[j])} for j in idx]
+        for linha, idx in zip(probs, ordem)
+    ]
+
+
+def consultar_tabela(tabela, versao_modelo, m, ocorrencia):
+    # O(1): devolve as probabilidades pré-calculadas ou None se a consulta estiver fora da tabela
+    if (not tabela or tabela["versao_modelo"] != versao_modelo or tabela["classes"] != m.classes_crime
+            or ocorrencia.idade_suspeito != tabela["idade_suspeito"] or ocorrencia.is_event not in (0, 1)):
+        return None
+    b = m.bairro_codigos.get(ocorrencia.bairro)
+    d = (_parse_data(ocorrencia.data_ocorrencia) - tabela["inicio"]).days
+    if b is None or not 0 <= d < tabela["dias"] or tabela["bairros"][b] != ocorrencia.bairro:
+        return None
+    return np.asarray(tabela["probs"][d, b, ocorrencia.is_event])
+
+
+def modelos_atuais():
+    recurso = registro.recurso("modelos")
+    if not recurso.carregado:
+        raise HTTPException(status_code=503, detail=f"Modelos indisponíveis: {recurso.erro}")
+    return recurso
+
+
+def prever(ocorrencias):
+    # uma única leitura do registro por requisição: modelos e tabela ficam consistentes até o fim
+    recurso = modelos_atuais()
+    m, versao = recurso.valor, recurso.versao
+    tabela = registro.valor("tabela_previsoes")
+
+    # ordem de consulta: cache -> tabela pré-calculada -> predict_proba (uma única vez para o que faltar)
+    X = montar_matriz(m, ocorrencias)
+    chaves = [(versao,) + tuple(linha) for linha in X.tolist()]
+    resultados = [cache_predicoes.get(chave) for chave in chaves]
+
+    faltando = []
+    for i, r in enumerate(resultados):
+        if r is not None:
+            continue
+        probs = consultar_tabela(tabela, versao, m, ocorrencias[i])
+        if probs is None:
+            faltando.append(i)
+        else:
+            resultados[i] = formatar_predicoes(m, probs[np.newaxis, :])[0]
+            cache_predicoes.set(chaves[i], resultados[i])
+
+    if faltando:
+        t0 = time.perf_counter()
+        probs = m.rf_model.predict_proba(X[faltando])
+        metricas.observar_etapa("inferencia", (time.perf_counter() - t0) * 1000)
+        for i, predicoes in zip(faltando, formatar_predicoes(m, probs)):
+            cache_predicoes.set(chaves[i], predicoes)
+            resultados[i] = predicoes
+    return resultados
+
+
+# /predict/ concorrentes são agrupados num único predict_proba rodando fora do event loop;
+# PREDICT_MAX_ESPERA_MS=0 desliga a espera (cada lote leva só o que já estiver na fila)
+agrupador = Agrupador(
+    prever,
+    max_espera_s=float(os.getenv("PREDICT_MAX_ESPERA_MS", "2")) / 1000,
+    max_lote=int(os.getenv("PREDICT_MAX_LOTE", "64")),
+)
+
+
 @router.post("/")
 async def fazerPredicao(ocorrencia: Ocorrencia):
-    
-    data_dt = datetime.strptime(ocorrencia.data_ocorrencia, "%Y-%m-%d")
-
-    entrada = {
-        "ano": data_dt.year,
-        "mes": data_dt.month,
-        "dia_da_semana": data_dt.weekday(),
-        "is_event": ocorrencia.is_event,
-        "bairro": ocorrencia.bairro,
-        "idade_suspeito": ocorrencia.idade_suspeito
-    }
 
-    entrada_df = pd.DataFrame([entrada])
+    # bairro desconhecido é recusado aqui, antes de entrar num lote
+    if ocorrencia.bairro not in modelos_atuais().valor.bairro_codigos:
+        raise HTTPException(status_code=422, detail=f"Bairro desconhecido: {ocorrencia.bairro}")
+    return {"predictions": await agrupador.submeter(ocorrencia)}
+
 
-    entrada_df["bairro"] = le_bairro.transform(entrada_df["bairro"].astype(str))
-    entrada_df["idade_suspeito"] = imputer.transform(entrada_df[["idade_suspeito"]])
+@router.post("/batch")
+async def fazerPredicaoLote(ocorrencias: List[Ocorrencia]):
 
-    probs = rf_model.predict_proba(entrada_df)[0]
-    classes = le_crime.inverse_transform(np.arange(len(probs)))
+    if not ocorrencias:
+        return {"results": []}
+    if len(ocorrencias) > MAX_LOTE:
+        raise HTTPException(status_code=413, detail=f"Lote acima do limite de {MAX_LOTE} ocorrências")
 
-    resultados = [{"tipo_crime": crime, "prob":float(prob)} for crime, prob in zip(classes, probs)]
-    resultados = sorted(resultados, key=lambda x: x["prob"], reverse=True)
-    
-    return {"predictions": resultados}
\ No newline at end of file
+    # resultados na mesma ordem da requisição; o lote (até MAX_LOTE linhas) roda numa thread
+    # para não travar o event loop enquanto isso
+    resultados = await asyncio.to_thread(prever, ocorrencias)
+    return {"results": [{"predictions": p} for p in resultados]}
+
+
+@router.get("/cache")
+async def estatisticasCache():
+    return {
+        "versao_modelo": registro.recurso("modelos").versao,
+        "motor": MOTOR,
+        **cache_predicoes.stats(),
+        "agrupamento": agrupador.stats(),
+    }
@@ -0,0 +1,63 @@
+# consultas espaciais sobre as ocorrências: raio em metros e k vizinhos mais próximos
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+import pandas as pd
+
+from espacial import IndiceEspacial
+from backend.registry import registro
+
+router = APIRouter(prefix="/spatial")
+
+ARQUIVO_OCORRENCIAS = "dataset_ocorrencias_delegacia.csv"
+COLUNAS = ["id_ocorrencia", "data_ocorrencia", "bairro", "tipo_crime", "latitude", "longitude"]
+
+# limite de ocorrências devolvidas por consulta
+MAX_RESULTADOS = 1000
+
+
+class OcorrenciasEspaciais:
+    """Colunas usadas na resposta + índice em grade sobre latitude/longitude."""
+
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        self.indice = IndiceEspacial(self.df["latitude"], self.df["longitude"])
+
+    def filtro(self, tipo_crime):
+        return None if tipo_crime is None else (self.df["tipo_crime"] == tipo_crime).to_numpy()
+
+    def registros(self, idx, dist):
+        linhas = self.df.iloc[idx]
+        linhas = linhas.astype(object).where(linhas.notna(), None)
+        return [
+            {**r, "distancia_m": round(float(d), 1)}
+            for r, d in zip(linhas.to_dict(orient="records"), dist)
+        ]
+
+
+registro.registrar("ocorrencias_espaciais", [ARQUIVO_OCORRENCIAS],
+                   lambda: OcorrenciasEspaciais(pd.read_csv(ARQUIVO_OCORRENCIAS, usecols=COLUNAS)))
+
+
+def dados_atuais():
+    dados = registro.valor("ocorrencias_espaciais")
+    if dados is None:
+        raise HTTPException(status_code=503, detail="Dataset principal não encontrado.")
+    return dados
+
+
+@router.get("/raio")
+async def ocorrenciasNoRaio(lat: float = Query(..., ge=-90, le=90), lon: float = Query(..., ge=-180, le=180),
+                            raio_m: float = Query(500, gt=0, le=50_000), tipo_crime: Optional[str] = None,
+                            limite: int = Query(100, ge=1, le=MAX_RESULTADOS)):
+    dados = dados_atuais()
+    idx, dist = dados.indice.raio(lat, lon, raio_m, dados.filtro(tipo_crime))
+    return {"total": len(idx), "ocorrencias": dados.registros(idx[:limite], dist[:limite])}
+
+
+@router.get("/vizinhos")
+async def vizinhosMaisProximos(lat: float = Query(..., ge=-90, le=90), lon: float = Query(..., ge=-180, le=180),
+                               k: int = Query(10, ge=1, le=MAX_RESULTADOS), tipo_crime: Optional[str] = None):
+    dados = dados_atuais()
+    idx, dist = dados.indice.vizinhos(lat, lon, k, dados.filtro(tipo_crime))
+    return {"ocorrencias": dados.registros(idx, dist)}
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Compara o modo linha a linha (df.apply + score_row) com o modo vetorizado de
+calssificar.classify_dataframe nos CSVs do repositório.
+
+Confere primeiro a paridade dos dois modos contra a implementação de referência
+(os laços originais sobre os dicionários da configuração, copiados abaixo) e depois
+mede o tempo de cada modo. Também compara o autômato de palavras-chave
+(KeywordMatcher) com a busca ingênua `kw in texto` conforme cresce o número
+de palavras-chave.
+
+Uso:
+    python benchmarks/bench_classificar.py [repeticoes_do_dataset]
+"""
+
+from pathlib import Path
+import random
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import calssificar  # noqa: E402
+
+DATASETS = [
+    "dataset_ocorrencias_delegacia.csv",
+    "dataset_ocorrencias_delegacia_5(in).csv",
+    "dataset_ocorrencias_delegacia_prioridade.csv",
+]
+
+
+# ---- referência: resolvers originais, sem CompiledRules/KeywordMatcher/cache ----
+# Mantidos aqui de propósito: se a ordem de "primeiro casamento" do autômato ou o cache
+# divergirem da busca por laço, os dois modos de classify_dataframe divergem desta referência.
+
+def _texto(x):
+    return "" if pd.isna(x) else str(x).lower()
+
+
+def _peso_crime(tipo_crime, descricao, cfg):
+    tipo = _texto(tipo_crime).strip()
+    crime_map = cfg["crime_weight_map"]
+    base = None
+    if tipo in crime_map:
+        base = crime_map[tipo]
+    else:
+        for k, v in crime_map.items():
+            if k in tipo and k != "outro":
+                base = v
+                break
+    if base is None:
+        base = crime_map.get("outro", 20)
+    desc = _texto(descricao)
+    max_kw = 0
+    for kw, w in cfg["keyword_crime_weight_map"].items():
+        if kw in desc:
+            max_kw = max(max_kw, w)
+    return max(base, max_kw)
+
+
+def _primeiro(texto, mapa):
+    for k, v in mapa.items():
+        if k in texto:
+            return v
+    return 0
+
+
+def _bonus(descricao, cfg):
+    desc = _texto(descricao)
+    return sum(v for k, v in cfg["modus_keyword_bonus"].items() if k in desc)
+
+
+def _inteiro(x):
+    try:
+        if pd.isna(x):
+            return 0
+        return int(float(re.sub(r"[^0-9.-]", "", str(x))))
+    except Exception:
+        return 0
+
+
+def score_referencia(row, cfg):
+    descricao = row.get("descricao_modus_operandi", "")
+    weapon_w = _primeiro(_texto(row.get("arma_utilizada", "")).strip(), cfg["weapon_weight_map"])
+    victims = _inteiro(row.get("quantidade_vitimas", 0))
+    suspects = _inteiro(row.get("quantidade_suspeitos", 0))
+    s = (_peso_crime(row.get("tipo_crime", ""), descricao, cfg) + weapon_w
+         + victims * cfg["victim_weight"] + suspects * cfg["suspect_weight"]
+         + _bonus(descricao, cfg)
+         + _primeiro(_texto(row.get("status_investigacao", "")).strip(), cfg["status_adj"]))
+    if weapon_w == 0 and victims >= 3 and suspects >= 2:
+        s += 5
+    return max(s, 0)
+
+
+def rotulo_referencia(score, cfg):
+    t = cfg["thresholds"]
+    if score >= t["muito_alta"]:
+        return "Muito Alta"
+    if score >= t["alta"]:
+        return "Alta"
+    if score >= t["media"]:
+        return "Média"
+    return "Baixa"
+
+
+def classificar_referencia(df, cfg=calssificar.DEFAULT_CONFIG):
+    df = df.copy()
+    for col in ["quantidade_vitimas", "quantidade_suspeitos"]:
+        df[col] = pd.to_numeric(df.get(col, 0), errors="coerce").fillna(0).astype(int)
+    scores = df.apply(lambda r: score_referencia(r, cfg), axis=1).to_numpy()
+    return scores, [rotulo_referencia(s, cfg) for s in scores]
+
+
+# chaves sobrepostas com pesos diferentes: só passa se a ordem do primeiro casamento for a do dicionário
+CONFIG_ORDEM = {
+    **calssificar.DEFAULT_CONFIG,
+    "weapon_weight_map": {"fogo": 7, "arma de fogo": 40, "arma": 3, "faca": 25},
+    "status_adj": {"andamento": 2, "em andamento": 20, "conclu": -1, "arquivado": -30},
+    "crime_weight_map": {**calssificar.DEFAULT_CONFIG["crime_weight_map"], "rou": 11},
+}
+
+
+def checar_paridade(df, cfg=calssificar.DEFAULT_CONFIG):
+    scores, rotulos = classificar_referencia(df, cfg)
+    for vectorized in (False, True):
+        out = calssificar.classify_dataframe(df, cfg, vectorized=vectorized)
+        modo = "vetorizado" if vectorized else "linha a linha"
+        diff = int((out["score_prioridade"].to_numpy() != scores).sum())
+        if diff:
+            raise AssertionError(f"{modo}: score_prioridade com {diff} linhas divergentes da referência")
+        diff = int((out["prioridade"].astype(str).to_numpy() != np.asarray(rotulos)).sum())
+        if diff:
+            raise AssertionError(f"{modo}: prioridade com {diff} linhas divergentes da referência")
+
+
+def cronometrar(df, vectorized):
+    t0 = time.perf_counter()
+    calssificar.classify_dataframe(df, vectorized=vectorized)
+    return time.perf_counter() - t0
+
+
+def bench_palavras_chave(textos, quantidades=(10, 100, 500)):
+    rng = random.Random(0)
+    vocab = sorted({p for t in textos for p in t.split()})
+    for n in quantidades:
+        keywords = [" ".join(rng.sample(vocab, 2)) if i % 3 else rng.choice(vocab)[:4] for i in range(n)]
+        matcher = calssificar.KeywordMatcher(keywords)
+        for t in textos[:200]:
+            assert matcher.find(t) == {k for k in keywords if k in t}
+
+        t0 = time.perf_counter()
+        for t in textos:
+            [k for k in keywords if k in t]
+        t_ingenuo = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for t in textos:
+            matcher.find(t)
+        t_automato = time.perf_counter() - t0
+        print(f"  {n:4d} palavras-chave: ingênuo {t_ingenuo:.3f}s | autômato {t_automato:.3f}s")
+
+
+def main(argv):
+    repeticoes = int(argv[1]) if len(argv) >= 2 else 1
+
+    for nome in DATASETS:
+        df = pd.read_csv(ROOT / nome)
+        checar_paridade(df)
+        checar_paridade(df, CONFIG_ORDEM)
+        print(f"{nome}: paridade OK ({len(df)} linhas)")
+
+    df = pd.read_csv(ROOT / DATASETS[0])
+    if repeticoes > 1:
+        df = pd.concat([df] * repeticoes, ignore_index=True)
+
+    t_linha = cronometrar(df, vectorized=False)
+    t_vetor = cronometrar(df, vectorized=True)
+    print(f"{len(df)} linhas")
+    print(f"  linha a linha: {t_linha:.3f}s")
+    print(f"  vetorizado:    {t_vetor:.3f}s  ({t_linha / t_vetor:.1f}x)")
+
+    textos = df["descricao_modus_operandi"].fillna("").astype(str).str.lower().tolist()
+    print(f"Palavras-chave em {len(textos)} descrições:")
+    bench_palavras_chave(textos)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Índice espacial em grade (espacial.IndiceEspacial) contra varredura por força bruta
+(haversine sobre todos os pontos) para consultas por raio e k vizinhos.
+
+Replica as coordenadas do dataset até N pontos (com ruído de ~200 m), confere que
+o índice devolve exatamente os mesmos pontos da varredura e mede a latência.
+
+Uso:
+    python benchmarks/bench_espacial.py [pontos] [consultas]
+"""
+
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from espacial import IndiceEspacial, haversine  # noqa: E402
+
+CSV = ROOT / "dataset_ocorrencias_delegacia.csv"
+
+
+def bruta_raio(lat, lon, lats, lons, raio_m):
+    dist = haversine(lat, lon, lats, lons)
+    idx = np.flatnonzero(dist <= raio_m)
+    return idx[np.argsort(dist[idx], kind="stable")]
+
+
+def bruta_vizinhos(lat, lon, lats, lons, k):
+    dist = haversine(lat, lon, lats, lons)
+    idx = np.argpartition(dist, k)[:k]
+    return idx[np.argsort(dist[idx], kind="stable")], dist
+
+
+def medir(fn, consultas):
+    tempos = []
+    for c in consultas:
+        t0 = time.perf_counter()
+        fn(*c)
+        tempos.append(time.perf_counter() - t0)
+    ms = np.array(tempos) * 1000
+    return np.percentile(ms, 50), np.percentile(ms, 99)
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) >= 2 else 2_000_000
+    q = int(argv[2]) if len(argv) >= 3 else 200
+    base = pd.read_csv(CSV, usecols=["latitude", "longitude"]).dropna()
+    rng = np.random.default_rng(0)
+    amostra = rng.integers(len(base), size=n)
+    lats = base["latitude"].to_numpy()[amostra] + rng.normal(0, 0.002, n)
+    lons = base["longitude"].to_numpy()[amostra] + rng.normal(0, 0.002, n)
+
+    t0 = time.perf_counter()
+    indice = IndiceEspacial(lats, lons, tamanho_celula_m=100)
+    print(f"índice: {n} pontos em {time.perf_counter() - t0:.2f}s")
+
+    centros = rng.integers(n, size=q)
+    consultas = [(lats[i] + rng.normal(0, 0.001), lons[i] + rng.normal(0, 0.001)) for i in centros]
+
+    for raio_m in (50, 200):
+        for lat, lon in consultas[:20]:
+            esperado = bruta_raio(lat, lon, lats, lons, raio_m)
+            obtido = indice.raio(lat, lon, raio_m)[0]
+            assert np.array_equal(np.sort(obtido), np.sort(esperado))
+        n_medio = np.mean([len(indice.raio(lat, lon, raio_m)[0]) for lat, lon in consultas[:20]])
+        for nome, fn in [("força bruta", lambda a, b: bruta_raio(a, b, lats, lons, raio_m)),
+                         ("índice", lambda a, b: indice.raio(a, b, raio_m))]:
+            p50, p99 = medir(fn, consultas if nome == "índice" else consultas[:20])
+            print(f"raio {raio_m:4d} m (~{n_medio:.0f} pontos) {nome:12s} p50 {p50:8.3f} ms | p99 {p99:8.3f} ms")
+
+    k = 10
+    for lat, lon in consultas[:20]:
+        esperado, dist = bruta_vizinhos(lat, lon, lats, lons, k)
+        assert np.allclose(indice.vizinhos(lat, lon, k)[1], dist[esperado])
+    for nome, fn in [("força bruta", lambda a, b: bruta_vizinhos(a, b, lats, lons, k)),
+                     ("índice", lambda a, b: indice.vizinhos(a, b, k))]:
+        p50, p99 = medir(fn, consultas if nome == "índice" else consultas[:20])
+        print(f"{k} vizinhos {nome:21s} p50 {p50:8.3f} ms | p99 {p99:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Marcação de eventos especiais: laço original do main.py (iterrows + df.loc por célula)
+contra eventos.marcar_eventos (vetor dia -> evento aplicado à coluna inteira).
+
+Replica o dataset até N linhas espalhando as datas por vários anos, acrescenta
+cópias dos eventos em outros anos (com janelas sobrepostas) e confere que os
+rótulos são idênticos. O laço original só roda numa amostra, por ser O(linhas x eventos).
+
+Uso:
+    python benchmarks/bench_eventos.py [linhas] [amostra_laco]
+"""
+
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from eventos import EVENTOS, marcar_eventos, processar_eventos  # noqa: E402
+
+CSV = ROOT / "dataset_ocorrencias_delegacia_5(in).csv"
+
+
+def marcar_laco(df, eventos_proc):
+    # caminho original do main.py
+    df = df.copy()
+    df["evento_especial"] = "Normal"
+    for idx, row in df.iterrows():
+        data = row["data_ocorrencia"].date()
+        for ev in eventos_proc:
+            if ev["inicio"] <= data <= ev["fim"]:
+                df.loc[idx, "evento_especial"] = ev["nome"]
+                break
+    return df["evento_especial"]
+
+
+def eventos_varios_anos(anos):
+    eventos = []
+    for ano in anos:
+        for ev in EVENTOS:
+            eventos.append({"nome": f"{ev['nome']} {ano}", "data": ev["data"].replace("2024", str(ano))})
+    return eventos
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) >= 2 else 1_000_000
+    amostra = int(argv[2]) if len(argv) >= 3 else 5_000
+    base = pd.read_csv(CSV, usecols=["data_ocorrencia"], parse_dates=["data_ocorrencia"])
+    rng = np.random.default_rng(0)
+    datas = base["data_ocorrencia"].sample(n, replace=True, random_state=0).reset_index(drop=True)
+    datas = datas + pd.to_timedelta(rng.integers(-3, 4, size=n) * 365, unit="D")
+    df = pd.DataFrame({"data_ocorrencia": datas})
+
+    for nome, eventos in [("eventos 2024", EVENTOS), ("eventos 2019-2027", eventos_varios_anos(range(2019, 2028)))]:
+        eventos_proc = processar_eventos(eventos, margem=5)
+
+        t0 = time.perf_counter()
+        rotulos = marcar_eventos(df["data_ocorrencia"], eventos_proc)
+        t_vetor = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        esperado = marcar_laco(df.head(amostra), eventos_proc)
+        t_laco = (time.perf_counter() - t0) / amostra * n
+
+        assert rotulos.head(amostra).equals(esperado)
+        print(f"{nome} ({len(eventos_proc)} eventos, {n} linhas): "
+              f"laço ~{t_laco:.1f}s (estimado) | vetorizado {t_vetor * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
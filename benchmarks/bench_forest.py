@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Floresta em vetores planos (backend/forest.py) contra o RandomForestClassifier do sklearn:
+confere que predict_proba é idêntico, mede a latência por tamanho de lote e a memória
+residente de um processo novo que carrega cada artefato.
+
+Exporta a floresta para um arquivo temporário a partir de models/modelo_rf.pkl.
+Rode a partir da raiz do repositório.
+
+Uso:
+    python benchmarks/bench_forest.py [repeticoes]
+"""
+
+from pathlib import Path
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path.cwd()))
+
+from backend.forest import FlorestaPlana  # noqa: E402
+
+warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
+
+ORIGEM = "models/modelo_rf.pkl"
+
+# mede o aumento de memória residente (VmRSS) ao carregar o artefato num processo limpo
+MEDIR_RSS = """
+import sys
+sys.path.insert(0, {raiz!r})
+import joblib, numpy, sklearn.ensemble
+from backend.forest import FlorestaPlana
+
+def rss():
+    for linha in open("/proc/self/status"):
+        if linha.startswith("VmRSS"):
+            return int(linha.split()[1])
+
+antes = rss()
+modelo = {carga}
+print(rss() - antes)
+"""
+
+
+def rss_kb(carga):
+    codigo = MEDIR_RSS.format(raiz=str(Path.cwd()), carga=carga)
+    return int(subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout)
+
+
+def entradas(n, rf, seed=0):
+    rng = np.random.default_rng(seed)
+    colunas = {
+        "ano": rng.integers(2020, 2027, n), "mes": rng.integers(1, 13, n),
+        "dia_da_semana": rng.integers(0, 7, n), "is_event": rng.integers(0, 2, n),
+        "bairro": rng.integers(0, 10, n), "idade_suspeito": rng.uniform(10, 90, n),
+    }
+    nomes = list(getattr(rf, "feature_names_in_", colunas))
+    return np.column_stack([colunas[c] for c in nomes]).astype(np.float64)
+
+
+def main(argv):
+    repeticoes = int(argv[1]) if len(argv) >= 2 else 50
+    rf = joblib.load(ORIGEM)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        destino = os.path.join(tmp, "modelo_rf_plano.npz")
+        t0 = time.perf_counter()
+        FlorestaPlana.de_sklearn(rf).salvar(destino)
+        print(f"exportação: {time.perf_counter() - t0:.2f}s, {os.path.getsize(destino) / 2**20:.1f} MB")
+        floresta = FlorestaPlana.carregar(destino)
+
+        X = entradas(20_000, rf)
+        assert np.array_equal(floresta.predict_proba(X), rf.predict_proba(X))
+
+        for lote in (1, 16, 256, 4096):
+            for nome, modelo in [("sklearn", rf), ("plano", floresta)]:
+                tempos = []
+                for r in range(repeticoes if lote < 4096 else max(3, repeticoes // 10)):
+                    Xl = X[r * lote % len(X):][:lote]
+                    t0 = time.perf_counter()
+                    modelo.predict_proba(Xl)
+                    tempos.append(time.perf_counter() - t0)
+                ms = np.array(tempos) * 1000
+                print(f"lote {lote:5d} {nome:8s} p50 {np.percentile(ms, 50):8.2f} ms | p99 {np.percentile(ms, 99):8.2f} ms")
+
+        print(f"RSS sklearn (joblib.load): {rss_kb(f'joblib.load({ORIGEM!r})') / 1024:7.1f} MB")
+        print(f"RSS plano (np.load):       {rss_kb(f'FlorestaPlana.carregar({destino!r})') / 1024:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
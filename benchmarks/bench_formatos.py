@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Compara CSV, Parquet e Feather como entrada do calssificar.py.
+
+Gera o dataset pontuado (replicado até N linhas) nos três formatos e mede,
+para cada um: tamanho em disco, tempo de leitura completa, tempo de leitura
+projetada (só as colunas de SCORE_COLUMNS) e memória do DataFrame resultante.
+
+Uso:
+    python benchmarks/bench_formatos.py [linhas]
+"""
+
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import calssificar  # noqa: E402
+
+
+def medir_leitura(path, columns=None, repeticoes=3):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        df = calssificar.read_table(path, columns)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor, df.memory_usage(deep=True).sum()
+
+
+def main(argv):
+    linhas = int(argv[1]) if len(argv) >= 2 else 500_000
+
+    base = pd.read_csv(ROOT / "dataset_ocorrencias_delegacia.csv", **calssificar.CSV_READ_OPTIONS)
+    df = pd.concat([base] * (linhas // len(base) + 1), ignore_index=True).head(linhas)
+    df = calssificar.classify_dataframe(df)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{linhas} linhas")
+        print(f"{'formato':10s} {'disco':>9s} {'leitura':>9s} {'memória':>9s} {'projetada':>10s} {'memória':>9s}")
+        for ext in [".csv", ".parquet", ".feather"]:
+            path = Path(tmp) / f"ocorrencias{ext}"
+            calssificar.write_table(df, path)
+            t_full, mem_full = medir_leitura(path)
+            t_proj, mem_proj = medir_leitura(path, calssificar.SCORE_COLUMNS)
+            print(
+                f"{ext[1:]:10s} {path.stat().st_size / 2**20:7.1f}MB "
+                f"{t_full:8.3f}s {mem_full / 2**20:7.1f}MB "
+                f"{t_proj:9.3f}s {mem_proj / 2**20:7.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Histórico local da Previsão: dados.IndiceHistorico contra a cadeia original de
+máscaras + value_counts().idxmax() sobre o DataFrame filtrado pelo período.
+
+Confere, para consultas aleatórias (bairro, evento, data e período), o crime e o
+número de ocorrências usadas, inclusive nos empates, e mede as duas versões.
+
+Uso:
+    python benchmarks/bench_historico.py [consultas]
+"""
+
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from dados import IndiceHistorico  # noqa: E402
+from eventos import EVENTOS, SEM_EVENTO, processar_eventos, marcar_eventos  # noqa: E402
+
+CSV = ROOT / "dataset_ocorrencias_delegacia.csv"
+
+
+def varredura(df, bairro, evento, data, inicio, fim):
+    # caminho original de paginas/previsao.py
+    df_filtrado = df[(df["data_ocorrencia"] >= inicio) & (df["data_ocorrencia"] <= fim)]
+    df_filtro = df_filtrado[
+        (df_filtrado["bairro"] == bairro) &
+        (df_filtrado["evento_especial"] == evento) &
+        (df_filtrado["data_ocorrencia"].dt.date == data)
+    ]
+    if len(df_filtro) == 0 and evento != SEM_EVENTO:
+        df_filtro = df_filtrado[(df_filtrado["bairro"] == bairro) & (df_filtrado["evento_especial"] == evento)]
+    if len(df_filtro) == 0:
+        df_filtro = df_filtrado[df_filtrado["bairro"] == bairro]
+    if len(df_filtro) == 0:
+        df_filtro = df_filtrado
+    if len(df_filtro) == 0 or df_filtro["tipo_crime"].isna().all():
+        return None, len(df_filtro)
+    return df_filtro["tipo_crime"].value_counts().idxmax(), len(df_filtro)
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) >= 2 else 1500
+    df = pd.read_csv(CSV, parse_dates=["data_ocorrencia"])
+    df["evento_especial"] = marcar_eventos(df["data_ocorrencia"], processar_eventos(EVENTOS, margem=5))
+
+    t0 = time.perf_counter()
+    indice = IndiceHistorico(df)
+    print(f"índice: {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    rng = np.random.default_rng(0)
+    bairros = df["bairro"].dropna().unique()
+    eventos = [SEM_EVENTO] + sorted(set(df["evento_especial"].dropna()) - {SEM_EVENTO})
+    datas = df["data_ocorrencia"].dropna().to_numpy()
+    consultas = []
+    for _ in range(n):
+        inicio, fim = np.sort(rng.choice(datas, 2))
+        consultas.append((
+            bairros[rng.integers(len(bairros))],
+            eventos[rng.integers(len(eventos))],
+            pd.Timestamp(rng.choice(datas)).date(),
+            pd.Timestamp(inicio).to_pydatetime(),
+            pd.Timestamp(fim).to_pydatetime(),
+        ))
+
+    t0 = time.perf_counter()
+    for c in consultas:
+        assert indice.mais_provavel(*c) == varredura(df, *c), c
+    t_varredura = time.perf_counter() - t0
+
+    tempos = []
+    for c in consultas:
+        t0 = time.perf_counter()
+        indice.mais_provavel(*c)
+        tempos.append(time.perf_counter() - t0)
+    us = np.array(tempos) * 1e6
+    print(f"{n} consultas iguais à varredura")
+    print(f"varredura + índice: {t_varredura / n * 1000:.1f} ms/consulta")
+    print(f"índice:             p50 {np.percentile(us, 50):.1f} µs | p99 {np.percentile(us, 99):.1f} µs")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Confere o modo incremental (--incremental) do calssificar.py e mede o ganho sobre a
+pontuação completa.
+
+Cenários conferidos num diretório temporário (a saída incremental tem de ser idêntica,
+byte a byte, à de uma execução normal com a mesma configuração):
+ - entrada só com cabeçalho e depois a entrada completa (estado salvo sem linhas);
+ - execução normal com outra configuração sobre a mesma saída, depois incremental de novo;
+ - algumas linhas alteradas: só elas são pontuadas.
+
+Uso:
+    python benchmarks/bench_incremental.py [repeticoes_do_dataset]
+"""
+
+from pathlib import Path
+import filecmp
+import json
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "calssificar.py"
+ORIGEM = ROOT / "dataset_ocorrencias_delegacia.csv"
+
+
+def rodar(*args):
+    r = subprocess.run([sys.executable, str(SCRIPT), *map(str, args)], capture_output=True, text=True)
+    if r.returncode != 0:
+        raise AssertionError(f"calssificar.py {' '.join(map(str, args))} falhou:\n{r.stderr}")
+    return r.stdout
+
+
+def contagem(saida):
+    # "Incremental: N linhas pontuadas, M reaproveitadas"
+    linha = next(l for l in saida.splitlines() if l.startswith("Incremental:"))
+    partes = linha.split()
+    return int(partes[1]), int(partes[4])
+
+
+def conferir(tmp):
+    tmp = Path(tmp)
+    entrada, saida, referencia = tmp / "in.csv", tmp / "out.csv", tmp / "ref.csv"
+    df = pd.read_csv(ORIGEM, dtype=str)
+
+    df.head(0).to_csv(entrada, index=False)
+    assert contagem(rodar(entrada, saida, "--incremental")) == (0, 0)
+    df.to_csv(entrada, index=False)
+    assert contagem(rodar(entrada, saida, "--incremental")) == (len(df), 0)
+    assert contagem(rodar(entrada, saida, "--incremental")) == (0, len(df))
+    rodar(entrada, referencia)
+    assert filecmp.cmp(saida, referencia, shallow=False)
+    print("cabeçalho -> completo: OK")
+
+    config = tmp / "cfg.json"
+    config.write_text(json.dumps({"victim_weight": 100}), encoding="utf-8")
+    rodar(entrada, saida, config)
+    assert contagem(rodar(entrada, saida, "--incremental")) == (len(df), 0)
+    assert filecmp.cmp(saida, referencia, shallow=False)
+    print("saída regravada por outra configuração: OK")
+
+    df.loc[:9, "arma_utilizada"] = "Arma de Fogo"
+    df.to_csv(entrada, index=False)
+    assert contagem(rodar(entrada, saida, "--incremental"))[0] <= 10
+    rodar(entrada, referencia)
+    assert filecmp.cmp(saida, referencia, shallow=False)
+    print("linhas alteradas: OK")
+
+
+def main(argv):
+    repeticoes = int(argv[1]) if len(argv) >= 2 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        conferir(tmp)
+
+        entrada, saida = Path(tmp) / "grande.csv", Path(tmp) / "grande_out.csv"
+        df = pd.read_csv(ORIGEM, dtype=str)
+        df = pd.concat([df] * repeticoes, ignore_index=True)
+        df["id_ocorrencia"] = [f"OCR{i}" for i in range(len(df))]
+        df.to_csv(entrada, index=False)
+
+        t0 = time.perf_counter()
+        rodar(entrada, saida, "--incremental")
+        t_completo = time.perf_counter() - t0
+        df.loc[: len(df) // 100, "status_investigacao"] = "Arquivado"
+        df.to_csv(entrada, index=False)
+        t0 = time.perf_counter()
+        pontuadas, reaproveitadas = contagem(rodar(entrada, saida, "--incremental"))
+        t_incremental = time.perf_counter() - t0
+        print(f"{len(df)} linhas: completo {t_completo:.2f}s | incremental {t_incremental:.2f}s "
+              f"({pontuadas} pontuadas, {reaproveitadas} reaproveitadas)")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
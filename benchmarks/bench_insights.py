@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Latência do /insight/ com o cubo dia x tipo_crime (backend/indices.py) contra
+a varredura original (read_csv + to_datetime + filtro por .dt.date + value_counts).
+
+Confere, para intervalos aleatórios, que as contagens e a ordem (inclusive dos
+empates) são as mesmas da varredura e mede a consulta no cubo.
+
+Uso:
+    python benchmarks/bench_insights.py [consultas]
+"""
+
+from datetime import timedelta
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.indices import CuboDiario  # noqa: E402
+
+CSV = ROOT / "dataset_ocorrencias_delegacia.csv"
+
+
+def varredura(data_inicio, data_fim):
+    # caminho original de get_insights
+    df = pd.read_csv(CSV)
+    df["data_ocorrencia"] = pd.to_datetime(df["data_ocorrencia"], errors="coerce")
+    df.dropna(subset=["data_ocorrencia"], inplace=True)
+    df = df[df["data_ocorrencia"].dt.date >= data_inicio]
+    df = df[df["data_ocorrencia"].dt.date <= data_fim]
+    return df["tipo_crime"].value_counts().head(10).to_dict()
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) >= 2 else 2000
+    df = pd.read_csv(CSV, usecols=["data_ocorrencia", "tipo_crime"])
+
+    t0 = time.perf_counter()
+    cubo = CuboDiario(df["data_ocorrencia"], df["tipo_crime"])
+    print(f"cubo: {len(cubo.dias)} dias x {len(cubo.categorias)} crimes em {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    rng = np.random.default_rng(0)
+    primeiro = pd.Timestamp(cubo.dias[0]).date()
+    span = (pd.Timestamp(cubo.dias[-1]).date() - primeiro).days
+    intervalos = []
+    for _ in range(n):
+        a, b = sorted(rng.integers(-10, span + 10, size=2))
+        intervalos.append((primeiro + timedelta(days=int(a)), primeiro + timedelta(days=int(b))))
+
+    t0 = time.perf_counter()
+    for a, b in intervalos[:20]:
+        # compara como lista: a ordem dos empates (e quem entra no top 10) também tem de bater
+        assert list(cubo.top(a, b, 10)[1].items()) == list(varredura(a, b).items())
+    t_varredura = (time.perf_counter() - t0) / 20
+
+    # ordem completa, sem o corte do top 10, contra o value_counts das linhas da janela
+    df["dia"] = pd.to_datetime(df["data_ocorrencia"], errors="coerce").dt.date
+    for a, b in intervalos[:500]:
+        janela = df[(df["dia"] >= a) & (df["dia"] <= b)]
+        esperado = list(janela["tipo_crime"].value_counts().to_dict().items())
+        assert list(cubo.top(a, b, None)[1].items()) == esperado, (a, b)
+
+    tempos = []
+    for a, b in intervalos:
+        t0 = time.perf_counter()
+        cubo.top(a, b, 10)
+        tempos.append(time.perf_counter() - t0)
+    us = np.array(tempos) * 1e6
+    print(f"varredura: {t_varredura * 1000:.1f} ms/consulta")
+    print(f"cubo:      p50 {np.percentile(us, 50):.1f} µs | p99 {np.percentile(us, 99):.1f} µs")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
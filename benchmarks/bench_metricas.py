@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Custo do MiddlewareMetricas e da RespostaJSON (backend/metricas.py) por requisição.
+
+Monta duas apps FastAPI com as mesmas rotas (uma sem instrumentação, outra com o middleware e
+a resposta medida) e chama a interface ASGI diretamente, sem servidor nem cliente HTTP, para
+que a diferença de tempo por requisição seja só a da instrumentação.
+
+Uso:
+    python benchmarks/bench_metricas.py [requisicoes]
+"""
+
+from pathlib import Path
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, str(Path.cwd()))
+
+from backend.metricas import Metricas, MiddlewareMetricas, RespostaJSON  # noqa: E402
+
+CORPO = {"predictions": [{"tipo_crime": f"crime {i}", "prob": 0.1} for i in range(10)]}
+
+
+def montar(instrumentada):
+    app = FastAPI(default_response_class=RespostaJSON if instrumentada else JSONResponse)
+
+    @app.get("/itens/{item}")
+    async def item(item: int):
+        return CORPO
+
+    if instrumentada:
+        app.add_middleware(MiddlewareMetricas, metricas=Metricas())
+    return app
+
+
+async def medir(app, n):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(mensagem):
+        pass
+
+    def scope(i):
+        return {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                "scheme": "http", "path": f"/itens/{i}", "raw_path": f"/itens/{i}".encode(),
+                "query_string": b"", "headers": [], "client": ("127.0.0.1", 1), "server": ("t", 80),
+                "root_path": ""}
+
+    for i in range(200):  # aquecimento (monta a pilha de middlewares)
+        await app(scope(i), receive, send)
+    t0 = time.perf_counter()
+    for i in range(n):
+        await app(scope(i), receive, send)
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) >= 2 else 20_000
+    simples, instrumentada = montar(False), montar(True)
+    # alterna as rodadas para diluir variações da máquina
+    tempos = {"sem métricas": [], "com métricas": []}
+    for _ in range(3):
+        tempos["sem métricas"].append(asyncio.run(medir(simples, n)))
+        tempos["com métricas"].append(asyncio.run(medir(instrumentada, n)))
+    base = min(tempos["sem métricas"])
+    for nome, us in tempos.items():
+        print(f"{nome:13s} {min(us):7.1f} µs/requisição (+{min(us) - base:5.1f} µs)")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
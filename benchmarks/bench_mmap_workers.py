@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Memória de N workers carregando os modelos do /predict/: .pkl com joblib.load (uma cópia por
+processo) contra os artefatos de backend/artefatos.py abertos com mmap_mode="r" (páginas do
+arquivo compartilhadas). Cada worker carrega, percorre todos os arrays (para que as páginas
+entrem de fato na memória) e espera os demais; só então lê Rss e Pss em /proc/self/smaps_rollup.
+Pss divide as páginas compartilhadas entre os processos: a soma é a memória física real.
+
+Exporta os artefatos para um diretório temporário. Rode a partir da raiz do repositório.
+
+Uso:
+    python benchmarks/bench_mmap_workers.py [workers]
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path.cwd()))
+
+from backend import artefatos  # noqa: E402
+
+WORKER = """
+import sys, time
+sys.path.insert(0, {raiz!r})
+import numpy as np
+import sklearn.ensemble, sklearn.impute, sklearn.preprocessing  # fora do tempo de carga
+from backend.artefatos import carregar
+
+def percorrer(obj, vistos):
+    # soma todos os arrays alcançáveis para forçar a leitura das páginas
+    if id(obj) in vistos:
+        return
+    vistos.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in "biuf":
+            obj.sum()
+        return
+    filhos = obj if isinstance(obj, (list, tuple)) else getattr(obj, "__dict__", {{}}).values()
+    for filho in filhos:
+        percorrer(filho, vistos)
+
+def memoria_kb():
+    campos = {{}}
+    for linha in open("/proc/self/smaps_rollup"):
+        partes = linha.split()
+        if partes[0] in ("Rss:", "Pss:"):
+            campos[partes[0][:-1]] = int(partes[1])
+    return campos
+
+t0 = time.perf_counter()
+modelos = [carregar(c) for c in {caminhos!r}]
+carga_ms = (time.perf_counter() - t0) * 1000
+percorrer(modelos, set())
+print("pronto", flush=True)
+sys.stdin.readline()
+m = memoria_kb()
+print(carga_ms, m["Rss"], m["Pss"], flush=True)
+"""
+
+
+def rodar(caminhos, workers):
+    codigo = WORKER.format(raiz=str(Path.cwd()), caminhos=list(caminhos))
+    procs = [subprocess.Popen([sys.executable, "-c", codigo], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+             for _ in range(workers)]
+    for p in procs:
+        assert p.stdout.readline().strip() == "pronto"
+    # todos carregados: agora o Pss reflete o compartilhamento entre eles
+    for p in procs:
+        p.stdin.write("\n")
+        p.stdin.flush()
+    resultados = [tuple(float(v) for v in p.stdout.readline().split()) for p in procs]
+    for p in procs:
+        p.wait()
+    return resultados
+
+
+def resumir(nome, resultados, base=(0.0, 0.0, 0.0)):
+    """Soma de Rss e Pss dos workers, descontado o processo vazio (Python + NumPy + sklearn)."""
+    carga = [r[0] for r in resultados]
+    rss = sum(r[1] - base[1] for r in resultados) / 1024
+    pss = sum(r[2] - base[2] for r in resultados) / 1024
+    print(f"{nome:18s} carga p50 {sorted(carga)[len(carga) // 2]:7.1f} ms | "
+          f"Rss somado {rss:7.1f} MB | Pss somado {pss:7.1f} MB")
+
+
+def main(argv):
+    workers = int(argv[1]) if len(argv) >= 2 else 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        artefatos.exportar(tmp)
+        print(f"exportação: {time.perf_counter() - t0:.1f}s; {workers} workers")
+        vazios = rodar([], workers)
+        base = tuple(sum(r[i] for r in vazios) / workers for i in range(3))
+
+        for motor in ("sklearn", "plano"):
+            origem = artefatos.resolver_modelos(motor, diretorio="/nao/existe")[0].values()
+            mmap = artefatos.resolver_modelos(motor, diretorio=tmp)[0].values()
+            resumir(f"{motor} original", rodar(origem, workers), base)
+            resumir(f"{motor} mmap", rodar(mmap, workers), base)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
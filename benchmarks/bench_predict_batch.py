@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput de POST /predict/batch contra N chamadas a POST /predict/.
+
+Monta as consultas de planejamento (todo bairro x cada dia dos próximos 30 dias),
+envia uma a uma para /predict/ e depois num único lote para /predict/batch,
+confere que as respostas coincidem e imprime previsões por segundo.
+
+Requer a API rodando (uvicorn backend.main:app).
+
+Uso:
+    python benchmarks/bench_predict_batch.py [API_URL] [dias]
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+import os
+import sys
+import time
+
+import pandas as pd
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def montar_consultas(dias):
+    bairros = sorted(pd.read_csv(ROOT / "dataset_ocorrencias_delegacia.csv", usecols=["bairro"])["bairro"].dropna().unique())
+    hoje = date.today()
+    return [
+        {"data_ocorrencia": (hoje + timedelta(days=d)).isoformat(), "bairro": b, "is_event": 0}
+        for d in range(dias)
+        for b in bairros
+    ]
+
+
+def main(argv):
+    api_url = argv[1] if len(argv) >= 2 else os.getenv("API_URL", "http://127.0.0.1:8000/predict").strip()
+    api_url = api_url.rstrip("/")
+    dias = int(argv[2]) if len(argv) >= 3 else 30
+    consultas = montar_consultas(dias)
+
+    with requests.Session() as sessao:
+        t0 = time.perf_counter()
+        individuais = [sessao.post(api_url + "/", json=c, timeout=30).json()["predictions"] for c in consultas]
+        t_individual = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        resposta = sessao.post(api_url + "/batch", json=consultas, timeout=300)
+        resposta.raise_for_status()
+        lote = [r["predictions"] for r in resposta.json()["results"]]
+        t_lote = time.perf_counter() - t0
+
+    assert lote == individuais, "resultados do lote diferem das chamadas individuais"
+    n = len(consultas)
+    print(f"{n} previsões")
+    print(f"  /predict/      : {t_individual:.2f}s ({n / t_individual:,.0f}/s)")
+    print(f"  /predict/batch : {t_lote:.2f}s ({n / t_lote:,.0f}/s, {t_individual / t_lote:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Teste de carga do POST /predict/ com clientes concorrentes: vazão e latência de cauda
+para diferentes configurações do agrupador (max_espera x max_lote, backend/batching.py).
+
+Roda a API no próprio processo (httpx + ASGITransport) e troca a configuração do
+agrupador entre as rodadas. Cada consulta tem idade_suspeito sorteada, então nenhuma é
+respondida pelo cache nem pela tabela pré-calculada: todas passam pelo modelo.
+Rode a partir da raiz do repositório (os modelos são lidos de models/).
+
+Uso:
+    python benchmarks/bench_predict_concorrencia.py [clientes] [requisicoes_por_cliente]
+"""
+
+from pathlib import Path
+import asyncio
+import sys
+import time
+
+import httpx
+import numpy as np
+
+sys.path.insert(0, str(Path.cwd()))
+
+from backend.main import app  # noqa: E402
+from backend.registry import registro  # noqa: E402
+from backend.routers import predict  # noqa: E402
+
+# (max_espera_ms, max_lote); (0, 1) = sem agrupamento, uma linha por predict_proba
+CONFIGURACOES = [(0, 1), (0, 64), (2, 64), (5, 128), (10, 256)]
+
+
+def consultas(n, seed=0):
+    bairros = list(registro.valor("modelos").bairro_codigos)
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "data_ocorrencia": f"2024-{rng.integers(1, 13):02d}-{rng.integers(1, 29):02d}",
+            "bairro": bairros[rng.integers(len(bairros))],
+            "is_event": int(rng.integers(2)),
+            "idade_suspeito": int(rng.integers(18, 80)),
+        }
+        for _ in range(n)
+    ]
+
+
+async def rodada(clientes, por_cliente, corpos):
+    latencias = []
+    transporte = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transporte, base_url="http://teste") as cliente:
+
+        async def usuario(u):
+            for i in range(por_cliente):
+                t0 = time.perf_counter()
+                r = await cliente.post("/predict/", json=corpos[u * por_cliente + i])
+                latencias.append(time.perf_counter() - t0)
+                r.raise_for_status()
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(usuario(u) for u in range(clientes)))
+        duracao = time.perf_counter() - t0
+    return duracao, np.array(latencias) * 1000
+
+
+async def main(argv):
+    clientes = int(argv[1]) if len(argv) >= 2 else 64
+    por_cliente = int(argv[2]) if len(argv) >= 3 else 10
+    corpos = consultas(clientes * por_cliente)
+
+    # confere que o resultado agrupado é o mesmo da predição isolada
+    predict.agrupador.max_espera_s, predict.agrupador.max_lote = 0.005, 64
+    predict.cache_predicoes.clear()
+    amostra = [predict.Ocorrencia(**c) for c in corpos[:32]]
+    agrupado = await asyncio.gather(*(predict.agrupador.submeter(o) for o in amostra))
+    predict.cache_predicoes.clear()
+    assert agrupado == [predict.prever([o])[0] for o in amostra]
+
+    print(f"{clientes} clientes x {por_cliente} requisições")
+    for espera_ms, lote in CONFIGURACOES:
+        predict.agrupador.max_espera_s, predict.agrupador.max_lote = espera_ms / 1000, lote
+        predict.agrupador.lotes = predict.agrupador.itens = 0
+        predict.cache_predicoes.clear()
+        duracao, ms = await rodada(clientes, por_cliente, corpos)
+        print(f"espera {espera_ms:3d} ms | lote até {lote:4d} | "
+              f"{len(ms) / duracao:7.1f} req/s | p50 {np.percentile(ms, 50):7.1f} ms | "
+              f"p99 {np.percentile(ms, 99):7.1f} ms | lote médio {predict.agrupador.stats()['lote_medio']}")
+    await predict.agrupador.fechar()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv))
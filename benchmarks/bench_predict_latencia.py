@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Latência (p50/p99) do /predict/ no processo: caminho antigo em pandas
+(strptime + DataFrame + LabelEncoder.transform + inverse_transform por chamada)
+contra o caminho NumPy atual (montar_matriz + tabelas pré-calculadas).
+
+Confere que os dois caminhos produzem as mesmas probabilidades.
+Rode a partir da raiz do repositório (os modelos são lidos de models/).
+
+Uso:
+    python benchmarks/bench_predict_latencia.py [chamadas]
+"""
+
+from datetime import datetime
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path.cwd()))
+
+from backend.registry import registro  # noqa: E402
+from backend.routers import predict  # noqa: E402
+
+m = registro.valor("modelos")
+
+
+def predicao_pandas(ocorrencia):
+    # caminho original de fazerPredicao
+    data_dt = datetime.strptime(ocorrencia.data_ocorrencia, "%Y-%m-%d")
+    entrada = {
+        "ano": data_dt.year,
+        "mes": data_dt.month,
+        "dia_da_semana": data_dt.weekday(),
+        "is_event": ocorrencia.is_event,
+        "bairro": ocorrencia.bairro,
+        "idade_suspeito": ocorrencia.idade_suspeito,
+    }
+    entrada_df = pd.DataFrame([entrada])
+    entrada_df["bairro"] = m.le_bairro.transform(entrada_df["bairro"].astype(str))
+    entrada_df["idade_suspeito"] = m.imputer.transform(entrada_df[["idade_suspeito"]])
+    probs = m.rf_model.predict_proba(entrada_df)[0]
+    classes = m.le_crime.inverse_transform(np.arange(len(probs)))
+    resultados = [{"tipo_crime": crime, "prob": float(prob)} for crime, prob in zip(classes, probs)]
+    return sorted(resultados, key=lambda x: x["prob"], reverse=True)
+
+
+def predicao_numpy(ocorrencia):
+    probs = m.rf_model.predict_proba(predict.montar_matriz(m, [ocorrencia]))
+    return predict.formatar_predicoes(m, probs)[0]
+
+
+def medir(fn, consultas):
+    tempos = []
+    for c in consultas:
+        t0 = time.perf_counter()
+        fn(c)
+        tempos.append(time.perf_counter() - t0)
+    ms = np.array(tempos) * 1000
+    return np.percentile(ms, 50), np.percentile(ms, 99)
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) >= 2 else 500
+    bairros = list(m.bairro_codigos)
+    rng = np.random.default_rng(0)
+    consultas = [
+        predict.Ocorrencia(
+            data_ocorrencia=f"2024-{rng.integers(1, 13):02d}-{rng.integers(1, 29):02d}",
+            bairro=bairros[rng.integers(len(bairros))],
+            is_event=int(rng.integers(2)),
+        )
+        for _ in range(n)
+    ]
+
+    for c in consultas[:50]:
+        antigo, novo = predicao_pandas(c), predicao_numpy(c)
+        assert [(str(r["tipo_crime"]), r["prob"]) for r in antigo] == [(r["tipo_crime"], r["prob"]) for r in novo]
+
+    for nome, fn in [("pandas (antes)", predicao_pandas), ("numpy (depois)", predicao_numpy)]:
+        p50, p99 = medir(fn, consultas)
+        print(f"{nome:15s} p50 {p50:6.2f} ms | p99 {p99:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
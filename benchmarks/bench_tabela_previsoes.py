@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Consulta na tabela pré-calculada de previsões contra predict_proba ao vivo.
+
+Gera a tabela (backend/precalcular_previsoes.py) num diretório temporário,
+confere que as probabilidades da tabela são idênticas às do modelo e mede a
+latência por consulta dos dois caminhos.
+Rode a partir da raiz do repositório (os modelos são lidos de models/).
+
+Uso:
+    python benchmarks/bench_tabela_previsoes.py [dias] [consultas]
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, str(Path.cwd()))
+
+from backend import precalcular_previsoes  # noqa: E402
+from backend.registry import registro  # noqa: E402
+from backend.routers import predict  # noqa: E402
+
+
+def medir(fn, consultas):
+    tempos = []
+    for c in consultas:
+        t0 = time.perf_counter()
+        fn(c)
+        tempos.append(time.perf_counter() - t0)
+    us = np.array(tempos) * 1e6
+    return np.percentile(us, 50), np.percentile(us, 99)
+
+
+def main(argv):
+    dias = int(argv[1]) if len(argv) >= 2 else 90
+    n = int(argv[2]) if len(argv) >= 3 else 300
+    hoje = date.today()
+    recurso = registro.recurso("modelos")
+    m = recurso.valor
+    bairros = list(m.bairro_codigos)
+    rng = np.random.default_rng(0)
+    consultas = [
+        predict.Ocorrencia(
+            data_ocorrencia=(hoje + timedelta(days=int(rng.integers(dias)))).isoformat(),
+            bairro=bairros[rng.integers(len(bairros))],
+            is_event=int(rng.integers(2)),
+        )
+        for _ in range(n)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        destino = os.path.join(tmp, "tabela_previsoes.npy")
+        t0 = time.perf_counter()
+        total = precalcular_previsoes.gerar_tabela(hoje, dias, destino)
+        print(f"tabela: {total} combinações em {time.perf_counter() - t0:.2f}s")
+        tabela = predict.carregar_tabela(destino)
+
+        def ao_vivo(c):
+            return m.rf_model.predict_proba(predict.montar_matriz(m, [c]))[0]
+
+        def na_tabela(c):
+            return predict.consultar_tabela(tabela, recurso.versao, m, c)
+
+        for c in consultas[:50]:
+            assert np.array_equal(na_tabela(c), ao_vivo(c))
+
+        for nome, fn in [("predict_proba", ao_vivo), ("tabela", na_tabela)]:
+            p50, p99 = medir(fn, consultas)
+            print(f"{nome:14s} p50 {p50:9.1f} µs | p99 {p99:9.1f} µs")
+        del tabela
+
+
+if __name__ == "__main__":
+    main(sys.argv)
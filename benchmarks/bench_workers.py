@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Mede o ganho do modo paralelo (--workers) do calssificar.py.
+
+Replica dataset_ocorrencias_delegacia.csv até N linhas (padrão: 1 milhão) num
+diretório temporário, pontua com 1 processo e com 2, 4, ... até o número de
+CPUs, confere que todas as saídas são idênticas byte a byte e imprime o speedup.
+
+Uso:
+    python benchmarks/bench_workers.py [linhas] [max_workers]
+"""
+
+from pathlib import Path
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import calssificar  # noqa: E402
+
+
+def replicar_csv(origem, destino, linhas):
+    with open(origem, "rb") as f:
+        header = f.readline()
+        corpo = f.readlines()
+    with open(destino, "wb") as out:
+        out.write(header)
+        escritas = 0
+        while escritas < linhas:
+            bloco = corpo[: linhas - escritas]
+            out.writelines(bloco)
+            escritas += len(bloco)
+
+
+def sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for bloco in iter(lambda: f.read(2**20), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def rodar(entrada, saida, workers):
+    t0 = time.perf_counter()
+    if workers == 1:
+        calssificar.classify_streaming(entrada, saida, chunksize=200_000)
+    else:
+        calssificar.classify_csv_parallel(entrada, saida, workers=workers)
+    return time.perf_counter() - t0
+
+
+def main(argv):
+    linhas = int(argv[1]) if len(argv) >= 2 else 1_000_000
+    max_workers = int(argv[2]) if len(argv) >= 3 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entrada = Path(tmp) / "ocorrencias.csv"
+        replicar_csv(ROOT / "dataset_ocorrencias_delegacia.csv", entrada, linhas)
+        print(f"{linhas} linhas ({entrada.stat().st_size / 2**20:.0f} MB), {os.cpu_count()} CPUs")
+
+        referencia = Path(tmp) / "saida_1.csv"
+        base = rodar(entrada, referencia, 1)
+        esperado = sha1(referencia)
+        print(f"  workers=1: {base:.2f}s")
+
+        workers = 2
+        while workers <= max_workers:
+            saida = Path(tmp) / f"saida_{workers}.csv"
+            t = rodar(entrada, saida, workers)
+            assert sha1(saida) == esperado, f"saída com workers={workers} difere da sequencial"
+            print(f"  workers={workers}: {t:.2f}s  ({base / t:.2f}x)")
+            saida.unlink()
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main(sys.argv)
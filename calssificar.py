@@ -8,9 +8,14 @@ Lê um CSV de ocorrências e adiciona duas colunas:
 
 Uso:
     python classificador_prioridade_crimes.py input.csv output.csv
+    python classificador_prioridade_crimes.py input.csv output.csv --chunksize 100000   # streaming
+    python classificador_prioridade_crimes.py input.csv output.csv --workers 8          # paralelo
+    python classificador_prioridade_crimes.py input.csv output.parquet                  # Parquet/Feather pela extensão
+    python classificador_prioridade_crimes.py input.csv output.csv --incremental        # só linhas novas/alteradas
 
 Dependências:
     pip install pandas
+    pip install pyarrow   # apenas para Parquet/Feather
 
 Descrição da lógica (resumo):
  - usa tipo_crime e palavras-chave em descricao_modus_operandi para definir um peso base
@@ -18,13 +23,27 @@ Descrição da lógica (resumo):
  - ajusta a pontuação segundo o status_investigacao e termos do modus operandi
  - converte pontuação em 4 níveis de prioridade
 
+classify_dataframe usa por padrão o modo vetorizado (score_dataframe), que resolve
+cada valor distinto uma vez e soma os pesos como arrays NumPy; o modo linha a linha
+(score_row via df.apply) continua disponível com vectorized=False. As regras de
+palavras-chave da configuração são compiladas num autômato (KeywordMatcher), usado
+tanto por este script quanto pelo dashboard (main.py).
+
 O arquivo contém um dicionário DEFAULT_CONFIG para você ajustar pesos e limiares.
 """
 
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import sys
+import os
+import io
+import argparse
 import re
 import json
+import hashlib
+import copy
+import threading
+from collections import OrderedDict, deque
 import pandas as pd
 import numpy as np
 
@@ -104,57 +123,271 @@ def clean_text(x):
     return str(x).lower()
 
 
-def get_crime_weight(tipo_crime, descricao, cfg):
-    tipo = clean_text(tipo_crime).strip()
-    crime_map = cfg["crime_weight_map"]
-    # tentativa direta por tipo
-    base = None
-    if tipo in crime_map:
-        base = crime_map[tipo]
-    else:
+# ------------------------- PALAVRAS-CHAVE -------------------------
+# Todas as regras "k in texto" da configuração (crime_weight_map, keyword_crime_weight_map,
+# modus_keyword_bonus, weapon_weight_map e status_adj) são compiladas num único autômato
+# Aho-Corasick: uma passada por texto devolve todas as palavras-chave encontradas, e o
+# custo não cresce com o número de palavras-chave cadastradas.
+
+class KeywordMatcher:
+    """Autômato Aho-Corasick: find(texto) devolve o conjunto de palavras-chave contidas no texto."""
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keywords))
+        goto = [{}]
+        out = [set()]
+        for kw in self.keywords:
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(set())
+                state = nxt
+            out[state].add(kw)
+
+        # links de falha em largura (BFS); a saída de cada estado herda a do seu link
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = fail[state]
+                    while f and ch not in goto[f]:
+                        f = fail[f]
+                    fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] |= out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [frozenset(o) for o in out]
+
+    def find(self, text):
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set(out[0])  # palavra-chave vazia casa com qualquer texto, como em `"" in texto`
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class CompiledRules:
+    """Regras de palavras-chave de uma configuração, compiladas uma única vez."""
+
+    def __init__(self, cfg, fingerprint=None):
+        self.fingerprint = fingerprint or config_fingerprint(cfg)
+        self.crime_map = cfg["crime_weight_map"]
+        self.keyword_crime_map = cfg["keyword_crime_weight_map"]
+        self.modus_map = cfg["modus_keyword_bonus"]
+        self.weapon_map = cfg["weapon_weight_map"]
+        self.status_map = cfg.get("status_adj", {})
+
+        # posição de cada chave no dicionário: a regra original usa a primeira chave que casar
+        self._crime_order = {k: i for i, k in enumerate(self.crime_map) if k != "outro"}
+        self._modus_order = {k: i for i, k in enumerate(self.modus_map)}
+        self._weapon_order = {k: i for i, k in enumerate(self.weapon_map)}
+        self._status_order = {k: i for i, k in enumerate(self.status_map)}
+
+        self.matcher = KeywordMatcher(
+            list(self.crime_map) + list(self.keyword_crime_map) + list(self.modus_map)
+            + list(self.weapon_map) + list(self.status_map)
+        )
+
+    @staticmethod
+    def _first(found, order, mapping, default):
+        hits = [k for k in found if k in order]
+        if not hits:
+            return default
+        return mapping[min(hits, key=order.__getitem__)]
+
+    def base_crime_weight(self, tipo):
+        # tentativa direta por tipo
+        if tipo in self.crime_map:
+            return self.crime_map[tipo]
         # busca por aproximação (palavras-chave em tipo_crime)
-        for k, v in crime_map.items():
-            if k in tipo and k != "outro":
-                base = v
-                break
-    if base is None:
-        base = cfg["crime_weight_map"].get("outro", 20)
+        found = self.matcher.find(tipo)
+        return self._first(found, self._crime_order, self.crime_map, self.crime_map.get("outro", 20))
+
+    def description_weights(self, desc):
+        """Uma passada na descrição -> (maior peso de keyword_crime_weight_map, soma de modus_keyword_bonus)."""
+        found = self.matcher.find(desc)
+        max_kw = 0
+        for kw in found:
+            if kw in self.keyword_crime_map:
+                max_kw = max(max_kw, self.keyword_crime_map[kw])
+        bonus = 0
+        for kw in sorted((k for k in found if k in self._modus_order), key=self._modus_order.__getitem__):
+            bonus += self.modus_map[kw]
+        return max_kw, bonus
+
+    def weapon_weight(self, arma):
+        return self._first(self.matcher.find(arma), self._weapon_order, self.weapon_map, 0)
+
+    def status_adjustment(self, status):
+        return self._first(self.matcher.find(status), self._status_order, self.status_map, 0)
+
+    # resolvedores sobre o valor bruto da coluna (o que o cache de pesos guarda)
+    def resolve_tipo(self, raw):
+        return self.base_crime_weight(clean_text(raw).strip())
+
+    def resolve_descricao(self, raw):
+        return self.description_weights(clean_text(raw))
+
+    def resolve_arma(self, raw):
+        return self.weapon_weight(clean_text(raw).strip())
+
+    def resolve_status(self, raw):
+        return self.status_adjustment(clean_text(raw).strip())
+
+
+_RULES_CACHE = {}
+_RULES_CACHE_MAX = 8
+
+# compile_rules é chamado a cada resolvedor usado sem `rules`: o fingerprint (json + sha1 da
+# config inteira) só é recalculado quando chega um objeto de config novo ou alterado. A entrada
+# guarda o próprio cfg (o id não é reaproveitado enquanto ele existir) e uma cópia do conteúdo.
+_RULES_BY_ID = {}
+
+
+def config_fingerprint(cfg):
+    """Hash estável do conteúdo da configuração."""
+    payload = json.dumps(cfg, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def compile_rules(cfg):
+    entry = _RULES_BY_ID.get(id(cfg))
+    if entry is not None and entry[0] is cfg and entry[1] == cfg:
+        return entry[2]
+
+    fp = config_fingerprint(cfg)
+    rules = _RULES_CACHE.get(fp)
+    if rules is None:
+        if len(_RULES_CACHE) >= _RULES_CACHE_MAX:
+            _RULES_CACHE.pop(next(iter(_RULES_CACHE)))
+        rules = _RULES_CACHE[fp] = CompiledRules(cfg, fp)
+    if len(_RULES_BY_ID) >= _RULES_CACHE_MAX:
+        _RULES_BY_ID.pop(next(iter(_RULES_BY_ID)))
+    _RULES_BY_ID[id(cfg)] = (cfg, copy.deepcopy(cfg), rules)
+    return rules
+# ----------------------- FIM PALAVRAS-CHAVE -----------------------
+
+
+# ------------------------- CACHE DE PESOS -------------------------
+# Os datasets têm poucas dezenas de valores distintos por coluna, então cada resolvedor
+# consulta antes um cache LRU limitado, com chave (fingerprint da config, resolvedor, valor).
+# Uma config diferente gera outro fingerprint, logo nunca reaproveita pesos antigos.
+# O cache é um objeto do módulo: execuções em lote e a API no mesmo processo o compartilham.
+
+class LookupCache:
+    """Cache LRU limitado e thread-safe com contadores de acertos, faltas e despejos."""
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute, raw):
+        # acerto: uma consulta ao dicionário, sem lock (operações do OrderedDict são atômicas
+        # sob o GIL; sob threads os contadores são aproximados)
+        data = self._data
+        value = data.get(key, _AUSENTE)
+        if value is not _AUSENTE:
+            self.hits += 1
+            try:
+                data.move_to_end(key)
+            except KeyError:  # despejado por outra thread entre as duas operações
+                pass
+            return value
+
+        value = compute(raw)
+        with self._lock:
+            self.misses += 1
+            data[key] = value
+            data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, fingerprint=None):
+        """Remove as entradas de uma configuração (ou todas, se fingerprint for None)."""
+        with self._lock:
+            if fingerprint is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if k[0] == fingerprint]:
+                    del self._data[key]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+_AUSENTE = object()
+
+LOOKUP_CACHE = LookupCache()
+
+
+def _cached(rules, resolver, raw, compute):
+    # NaN != NaN: valores ausentes viram None na chave (str, o caso comum, não passa por pd.isna)
+    if raw.__class__ is not str and pd.isna(raw):
+        raw = None
+    return LOOKUP_CACHE.get_or_compute((rules.fingerprint, resolver, raw), compute, raw)
+# ----------------------- FIM CACHE DE PESOS -----------------------
+
+
+def base_crime_weight(tipo_crime, cfg, rules=None):
+    rules = rules or compile_rules(cfg)
+    return _cached(rules, "tipo_crime", tipo_crime, rules.resolve_tipo)
+
 
+def description_weights(descricao, cfg, rules=None):
+    rules = rules or compile_rules(cfg)
+    return _cached(rules, "descricao", descricao, rules.resolve_descricao)
+
+
+def keyword_crime_weight(descricao, cfg, rules=None):
+    return description_weights(descricao, cfg, rules)[0]
+
+
+def get_crime_weight(tipo_crime, descricao, cfg, rules=None):
     # keywords na descricao podem indicar crime mais grave: usamos o maior entre base e keyword
-    desc = clean_text(descricao)
-    max_kw = 0
-    for kw, w in cfg["keyword_crime_weight_map"].items():
-        if kw in desc:
-            max_kw = max(max_kw, w)
-    return max(base, max_kw)
-
-
-def get_weapon_weight(arma, cfg):
-    a = clean_text(arma).strip()
-    wm = cfg["weapon_weight_map"]
-    # busca direta
-    for k, v in wm.items():
-        if k in a:
-            return v
-    # número/descrição desconhecida
-    return 0
-
-
-def modus_bonus(descricao, cfg):
-    desc = clean_text(descricao)
-    bonus = 0
-    for k, v in cfg["modus_keyword_bonus"].items():
-        if k in desc:
-            bonus += v
-    return bonus
-
-
-def status_adjustment(status, cfg):
-    s = clean_text(status).strip()
-    for k, v in cfg["status_adj"].items():
-        if k in s:
-            return v
-    return 0
+    rules = rules or compile_rules(cfg)
+    return max(base_crime_weight(tipo_crime, cfg, rules), keyword_crime_weight(descricao, cfg, rules))
+
+
+def get_weapon_weight(arma, cfg, rules=None):
+    rules = rules or compile_rules(cfg)
+    # número/descrição desconhecida -> 0
+    return _cached(rules, "arma", arma, rules.resolve_arma)
+
+
+def modus_bonus(descricao, cfg, rules=None):
+    return description_weights(descricao, cfg, rules)[1]
+
+
+def status_adjustment(status, cfg, rules=None):
+    rules = rules or compile_rules(cfg)
+    return _cached(rules, "status", status, rules.resolve_status)
 
 
 def safe_int(x):
@@ -167,14 +400,22 @@ def safe_int(x):
         return 0
 
 
-def score_row(row, cfg):
+# colunas lidas por score_row
+ROW_COLUMNS = ["tipo_crime", "descricao_modus_operandi", "arma_utilizada", "status_investigacao",
+               "quantidade_vitimas", "quantidade_suspeitos"]
+
+
+def score_row(row, cfg, rules=None):
+    rules = rules or compile_rules(cfg)
     tipo = row.get("tipo_crime", "")
     descricao = row.get("descricao_modus_operandi", "")
     arma = row.get("arma_utilizada", "")
     status = row.get("status_investigacao", "")
 
-    crime_w = get_crime_weight(tipo, descricao, cfg)
-    weapon_w = get_weapon_weight(arma, cfg)
+    # uma única consulta à descrição serve ao peso do crime e ao bônus do modus operandi
+    kw_w, bonus = description_weights(descricao, cfg, rules)
+    crime_w = max(base_crime_weight(tipo, cfg, rules), kw_w)
+    weapon_w = get_weapon_weight(arma, cfg, rules)
     victims = safe_int(row.get("quantidade_vitimas", 0))
     suspects = safe_int(row.get("quantidade_suspeitos", 0))
 
@@ -183,8 +424,8 @@ def score_row(row, cfg):
     s += weapon_w
     s += victims * cfg["victim_weight"]
     s += suspects * cfg["suspect_weight"]
-    s += modus_bonus(descricao, cfg)
-    s += status_adjustment(status, cfg)
+    s += bonus
+    s += status_adjustment(status, cfg, rules)
 
     # pequenas regras extras (opcionais)
     # se não há informação de arma, mas há muitos suspeitos e muitas vítimas, aumentar um pouco
@@ -208,20 +449,596 @@ def score_to_label(score, cfg):
     return "Baixa"
 
 
-def classify_dataframe(df: pd.DataFrame, cfg=DEFAULT_CONFIG) -> pd.DataFrame:
-    df = df.copy()
+# ------------------------- MODO VETORIZADO -------------------------
+# Mesma lógica de score_row/score_to_label, mas coluna a coluna: cada valor distinto
+# de tipo_crime/arma_utilizada/status_investigacao/descricao_modus_operandi é resolvido
+# uma única vez pelas regras compiladas e os pesos são somados como arrays NumPy.
+
+def _text_column(df, col):
+    """Equivalente vetorizado de clean_text aplicado à coluna (ausente -> "")."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        s = s.astype(object)
+    return s.where(s.notna(), "").astype(str).str.lower()
+
+
+def _spread(weights, codes):
+    if len(weights) == 0:
+        return np.zeros(len(codes), dtype=np.int64)
+    return np.asarray(weights)[codes]
+
+
+def _resolve_unique(values: pd.Series, resolver):
+    """Resolve o peso de cada valor distinto uma vez e espalha o resultado pelas linhas."""
+    codes, uniques = pd.factorize(values, sort=False)
+    return _spread([resolver(u) for u in uniques], codes)
+
+
+def score_dataframe(df: pd.DataFrame, cfg=DEFAULT_CONFIG) -> np.ndarray:
+    """Calcula score_prioridade para todas as linhas de uma vez (resultado idêntico a score_row)."""
+    rules = compile_rules(cfg)
+    tipo = _text_column(df, "tipo_crime").str.strip()
+    desc = _text_column(df, "descricao_modus_operandi")
+    arma = _text_column(df, "arma_utilizada").str.strip()
+    status = _text_column(df, "status_investigacao").str.strip()
+
+    # cada descrição distinta passa uma vez pelo autômato de palavras-chave
+    codes, uniques = pd.factorize(desc, sort=False)
+    desc_w = [description_weights(u, cfg, rules) for u in uniques]
+    kw_w = _spread([w[0] for w in desc_w], codes)
+    bonus = _spread([w[1] for w in desc_w], codes)
+
+    crime_w = np.maximum(_resolve_unique(tipo, lambda t: base_crime_weight(t, cfg, rules)), kw_w)
+    weapon_w = _resolve_unique(arma, lambda a: get_weapon_weight(a, cfg, rules))
+    status_w = _resolve_unique(status, lambda st: status_adjustment(st, cfg, rules))
+
+    victims = _numeric_column(df, "quantidade_vitimas")
+    suspects = _numeric_column(df, "quantidade_suspeitos")
 
+    s = crime_w + weapon_w
+    s = s + victims * cfg["victim_weight"]
+    s = s + suspects * cfg["suspect_weight"]
+    s = s + bonus
+    s = s + status_w
+
+    # mesma regra extra de score_row
+    s = np.where((weapon_w == 0) & (victims >= 3) & (suspects >= 2), s + 5, s)
+
+    # não deixar negativo
+    return np.where(s < 0, 0, s)
+
+
+def labels_from_scores(scores, cfg=DEFAULT_CONFIG) -> np.ndarray:
+    """Versão vetorizada de score_to_label."""
+    t = cfg["thresholds"]
+    scores = np.asarray(scores)
+    return np.select(
+        [scores >= t["muito_alta"], scores >= t["alta"], scores >= t["media"]],
+        ["Muito Alta", "Alta", "Média"],
+        default="Baixa",
+    ).astype(object)
+
+
+def _numeric_column(df, col):
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=np.int64)
+    values = df[col]
+    if pd.api.types.is_integer_dtype(values):
+        return values.to_numpy(dtype=np.int64)
+    return values.map(safe_int).to_numpy(dtype=np.int64)
+# ----------------------- FIM MODO VETORIZADO -----------------------
+
+
+def _coerce_counts(df):
     # garantir colunas numéricas
     df["quantidade_vitimas"] = pd.to_numeric(df.get("quantidade_vitimas", 0), errors="coerce").fillna(0).astype(int)
     df["quantidade_suspeitos"] = pd.to_numeric(df.get("quantidade_suspeitos", 0), errors="coerce").fillna(0).astype(int)
 
+
+def classify_dataframe(df: pd.DataFrame, cfg=DEFAULT_CONFIG, vectorized=True, copy=True) -> pd.DataFrame:
+    # copy=False reaproveita o próprio df (ex.: blocos lidos em modo streaming)
+    if copy:
+        df = df.copy()
+
+    _coerce_counts(df)
+
     # aplicar
-    df["score_prioridade"] = df.apply(lambda r: score_row(r, cfg), axis=1)
-    df["prioridade"] = df["score_prioridade"].apply(lambda s: score_to_label(s, cfg))
+    if vectorized:
+        scores = score_dataframe(df, cfg)
+        df["score_prioridade"] = pd.Series(scores, index=df.index)
+        df["prioridade"] = pd.Series(labels_from_scores(scores, cfg), index=df.index)
+    else:
+        # dicionários por linha em vez de df.apply(axis=1): montar uma Series por linha custava
+        # mais que resolver os pesos, que aqui saem do cache
+        rules = compile_rules(cfg)
+        cols = [c for c in ROW_COLUMNS if c in df.columns]
+        rows = (dict(zip(cols, values)) for values in zip(*(df[c].tolist() for c in cols)))
+        scores = [score_row(r, cfg, rules) for r in rows]
+        df["score_prioridade"] = pd.Series(scores, index=df.index, dtype=np.int64)
+        df["prioridade"] = df["score_prioridade"].apply(lambda s: score_to_label(s, cfg))
 
     return df
 
 
+class PrioritySummary:
+    """Contagem incremental por prioridade, na mesma ordem de value_counts(dropna=False)."""
+
+    def __init__(self):
+        self._counts = {}
+
+    def add(self, prioridades: pd.Series):
+        self.add_counts(prioridades.value_counts(dropna=False, sort=False).to_dict())
+
+    def add_counts(self, counts):
+        # value_counts mantém a ordem de primeira aparição antes de ordenar; o dict também
+        for k, v in counts.items():
+            self._counts[k] = self._counts.get(k, 0) + int(v)
+
+    def to_dict(self):
+        if not self._counts:
+            return {}
+        return pd.Series(self._counts, dtype="int64").sort_values(ascending=False, kind="stable").to_dict()
+
+
+# ------------------------- FORMATOS -------------------------
+# Entrada e saída em CSV, Parquet ou Feather, escolhidos pela extensão do arquivo.
+# Nos formatos colunares (requerem pyarrow) as colunas categóricas são gravadas com
+# dictionary encoding, datas e números têm tipo fixo por coluna e a leitura pode ser projetada só
+# nas colunas que o classificador usa.
+
+COLUMNAR_FORMATS = {".parquet": "parquet", ".pq": "parquet", ".feather": "feather", ".arrow": "feather"}
+
+# colunas de que score_dataframe precisa
+SCORE_COLUMNS = [
+    "tipo_crime", "descricao_modus_operandi", "arma_utilizada",
+    "status_investigacao", "quantidade_vitimas", "quantidade_suspeitos",
+]
+
+CATEGORICAL_COLUMNS = [
+    "bairro", "tipo_crime", "descricao_modus_operandi", "arma_utilizada", "sexo_suspeito",
+    "orgao_responsavel", "status_investigacao", "prioridade",
+]
+
+# As colunas de CSV são lidas como texto: a saída reproduz exatamente os valores de entrada e
+# não depende de como o arquivo foi dividido em blocos (a inferência de tipos do pandas é feita
+# por bloco e poderia, p.ex., escrever "53.0" num bloco e "53" em outro).
+# quantidade_vitimas/quantidade_suspeitos são convertidas em classify_dataframe.
+CSV_READ_OPTIONS = {"dtype": str}
+
+
+def table_format(path):
+    return COLUMNAR_FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.feather
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet/Feather requerem pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def available_columns(path):
+    fmt = table_format(path)
+    if fmt == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    pa = _pyarrow()
+    if fmt == "parquet":
+        return pa.parquet.read_schema(path).names
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema.names
+
+
+def read_table(path, columns=None):
+    """Lê CSV/Parquet/Feather; `columns` restringe a leitura às colunas indicadas."""
+    fmt = table_format(path)
+    if fmt == "csv":
+        usecols = None if columns is None else (lambda c: c in columns)
+        return pd.read_csv(path, usecols=usecols, **CSV_READ_OPTIONS)
+    _pyarrow()
+    if fmt == "parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+def iter_table_chunks(path, chunksize, columns=None):
+    fmt = table_format(path)
+    if fmt == "csv":
+        usecols = None if columns is None else (lambda c: c in columns)
+        with pd.read_csv(path, chunksize=chunksize, usecols=usecols, **CSV_READ_OPTIONS) as reader:
+            yield from reader
+        return
+    pa = _pyarrow()
+    if fmt == "parquet":
+        for batch in pa.parquet.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        for batch in table.to_batches(max_chunksize=chunksize):
+            yield batch.to_pandas()
+
+
+# Tipo de cada coluna na saída colunar, fixo para todos os blocos (nunca inferido do conteúdo,
+# que muda de um bloco para outro). Valores que não convertem viram nulos, como em data_ocorrencia.
+# Colunas de texto fora deste mapa e de CATEGORICAL_COLUMNS ficam como string, sem perda.
+COLUMNAR_TYPES = {
+    "data_ocorrencia": "datetime",
+    "latitude": "float",
+    "longitude": "float",
+    "quantidade_vitimas": "int",
+    "quantidade_suspeitos": "int",
+    "score_prioridade": "int",
+}
+
+
+def _extend_dictionary(dictionaries, col, values):
+    known = dictionaries.setdefault(col, {})
+    for v in values.dropna().unique():
+        if v not in known:
+            known[v] = len(known)
+    return known
+
+
+def _to_arrow(df, dictionaries, schema=None):
+    """Converte para Arrow com tipos fixos por coluna e codificando as categóricas.
+
+    `dictionaries` guarda, por coluna, os valores já vistos na ordem de aparição: cada bloco
+    só acrescenta valores novos ao fim do dicionário (delta), como exige o formato Feather.
+    """
+    pa = _pyarrow()
+    df = df.copy()
+    categorical = [c for c in df.columns if c in CATEGORICAL_COLUMNS]
+    text, ints = [], []
+    for col in df.columns:
+        kind = COLUMNAR_TYPES.get(col)
+        if col in categorical:
+            continue
+        if kind == "datetime":
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        elif kind == "float":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+        elif kind == "int":
+            ints.append(col)
+        elif df[col].dtype == object or pd.api.types.is_string_dtype(df[col]):
+            text.append(col)
+
+    encoded = {}
+    for col in categorical:
+        values = df[col].astype("string")
+        known = _extend_dictionary(dictionaries, col, values)
+        codes = pd.Categorical(values, categories=list(known)).codes.astype(np.int32)
+        encoded[col] = pa.DictionaryArray.from_arrays(
+            pa.array(codes, mask=codes < 0), pa.array(list(known), type=pa.string())
+        )
+        df[col] = None
+
+    # texto sempre como string, mesmo num bloco só de nulos (que o Arrow tiparia como null)
+    for col in text:
+        values = df[col].astype("string")
+        encoded[col] = pa.array(values.to_numpy(dtype=object, na_value=None), type=pa.string())
+        df[col] = None
+
+    for col in ints:
+        values = pd.to_numeric(df[col], errors="coerce")
+        encoded[col] = pa.array(values, type=pa.int64(), from_pandas=True)
+        df[col] = None
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for col, arr in encoded.items():
+        i = table.column_names.index(col)
+        table = table.set_column(i, col, arr)
+    if schema is not None:
+        table = table.cast(schema)
+    return table
+
+
+class TableWriter:
+    """Grava blocos sucessivos de DataFrame em CSV, Parquet ou Feather."""
+
+    def __init__(self, path):
+        self.path = path
+        self.format = table_format(path)
+        self._writer = None
+        self._sink = None
+        self._schema = None
+        self._dictionaries = {}
+        # Feather: o Arrow trata dicionário vazio -> não vazio como substituição (proibida no
+        # arquivo IPC), não como delta. Os primeiros blocos ficam retidos até toda coluna
+        # categórica ter algum valor; se alguma ficar nula até o fim, tudo sai em close().
+        self._pending = []
+        self._seen = set()
+
+    def write(self, df):
+        if self.format == "csv":
+            if self._sink is None:
+                self._sink = open(self.path, "w", encoding="utf-8", newline="")
+                df.to_csv(self._sink, index=False, header=True)
+            else:
+                df.to_csv(self._sink, index=False, header=False)
+            return
+        if self.format == "feather" and self._writer is None:
+            self._pending.append(df)
+            categorical = [c for c in df.columns if c in CATEGORICAL_COLUMNS]
+            for col in categorical:
+                # o primeiro lote gravado já leva os valores dos blocos retidos depois dele
+                if _extend_dictionary(self._dictionaries, col, df[col].astype("string")):
+                    self._seen.add(col)
+            if self._seen.issuperset(categorical):
+                self._flush_pending()
+            return
+        self._write_arrow(df)
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, []
+        for df in pending:
+            self._write_arrow(df)
+
+    def _write_arrow(self, df):
+        pa = _pyarrow()
+        table = _to_arrow(df, self._dictionaries, self._schema)
+        if self._writer is None:
+            self._schema = table.schema
+            if self.format == "parquet":
+                self._writer = pa.parquet.ParquetWriter(self.path, self._schema)
+            else:
+                self._sink = pa.OSFile(str(self.path), "wb")
+                options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+                self._writer = pa.ipc.new_file(self._sink, self._schema, options=options)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._pending:
+            self._flush_pending()
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_table(df, path):
+    with TableWriter(path) as writer:
+        writer.write(df)
+
+
+def classify_streaming(input_path, output_path, cfg=DEFAULT_CONFIG, chunksize=100_000, columns=None):
+    """Lê, pontua e grava o arquivo bloco a bloco; a memória fica limitada ao tamanho do bloco."""
+    resumo = PrioritySummary()
+    with TableWriter(output_path) as writer:
+        for chunk in iter_table_chunks(input_path, chunksize, columns):
+            chunk = classify_dataframe(chunk, cfg, copy=False)
+            writer.write(_output_columns(chunk, columns))
+            resumo.add(chunk["prioridade"])
+    return resumo.to_dict()
+
+
+def _output_columns(df, columns):
+    # com leitura projetada, a saída traz só a identificação e o resultado
+    if columns is None:
+        return df
+    keep = [c for c in ["id_ocorrencia", "score_prioridade", "prioridade"] if c in df.columns]
+    return df[keep]
+# ----------------------- FIM FORMATOS -----------------------
+
+
+# ------------------------- MODO PARALELO -------------------------
+# O arquivo é dividido em faixas de bytes alinhadas em quebras de linha (uma ocorrência por
+# linha). Cada processo lê, pontua e serializa a sua faixa; o processo principal só grava
+# os textos na ordem das faixas, então a saída é idêntica à de uma execução sequencial.
+
+def split_byte_ranges(path, target_bytes, block_size=1 << 20):
+    """Devolve (cabeçalho, [(início, fim), ...]) com faixas terminando em fim de registro.
+
+    Campos entre aspas podem conter quebras de linha (ex.: descricao_modus_operandi), então uma
+    quebra só encerra o registro se o número de aspas desde o início do arquivo for par; aspas
+    escapadas ("") não mudam a paridade. O arquivo é lido uma vez, em blocos.
+    """
+    size = os.path.getsize(path)
+    cuts = []  # posição logo após cada fim de registro escolhido; o primeiro fecha o cabeçalho
+    quotes = 0
+    target = 0
+    with open(path, "rb") as f:
+        base = 0
+        while base < size:
+            block = f.read(block_size)
+            if not block:
+                break
+            i = 0
+            while base + len(block) > target:
+                start = max(i, target - base)
+                quotes += block.count(b'"', i, start)
+                nl = block.find(b"\n", start)
+                if nl < 0:
+                    i = start
+                    break
+                quotes += block.count(b'"', start, nl)
+                i = nl + 1
+                if quotes % 2 == 0:
+                    cuts.append(base + i)
+                    target = base + i + target_bytes
+            quotes += block.count(b'"', i)
+            base += len(block)
+
+        if not cuts:
+            f.seek(0)
+            return f.read(), []
+        f.seek(0)
+        header = f.read(cuts[0])
+    if cuts[-1] < size:
+        cuts.append(size)
+    return header, list(zip(cuts[:-1], cuts[1:]))
+
+
+def _classify_byte_range(path, start, end, header, cfg, write_header):
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    df = pd.read_csv(io.BytesIO(header + data), **CSV_READ_OPTIONS)
+    out = classify_dataframe(df, cfg, copy=False)
+    counts = out["prioridade"].value_counts(dropna=False, sort=False).to_dict()
+    return out.to_csv(index=False, header=write_header), counts
+
+
+def classify_csv_parallel(input_csv, output_csv, cfg=DEFAULT_CONFIG, workers=2, target_bytes=None):
+    """Pontua o CSV em `workers` processos, preservando a ordem original das linhas."""
+    size = os.path.getsize(input_csv)
+    if target_bytes is None:
+        # ~4 faixas por processo para equilibrar a carga, limitadas a 64 MB cada
+        target_bytes = min(64 * 2**20, max(2**20, size // (workers * 4)))
+    header, ranges = split_byte_ranges(input_csv, target_bytes)
+    if not ranges:
+        out = classify_dataframe(pd.read_csv(input_csv, **CSV_READ_OPTIONS), cfg)
+        out.to_csv(output_csv, index=False)
+        return out["prioridade"].value_counts(dropna=False).to_dict()
+
+    resumo = PrioritySummary()
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(output_csv, "w", encoding="utf-8", newline="") as out:
+        pending = deque()
+        for i, (start, end) in enumerate(ranges):
+            pending.append(pool.submit(_classify_byte_range, str(input_csv), start, end, header, cfg, i == 0))
+            # no máximo 2 faixas por processo em memória
+            while len(pending) >= workers * 2:
+                text, counts = pending.popleft().result()
+                out.write(text)
+                resumo.add_counts(counts)
+        while pending:
+            text, counts = pending.popleft().result()
+            out.write(text)
+            resumo.add_counts(counts)
+    return resumo.to_dict()
+# ----------------------- FIM MODO PARALELO -----------------------
+
+
+# ------------------------- MODO INCREMENTAL -------------------------
+# Ao lado da saída ficam dois arquivos de estado: <saida>.hashes.csv, com um hash do conteúdo
+# de cada linha de entrada por id_ocorrencia, e <saida>.estado.json, com o fingerprint da
+# configuração e o tamanho/data de modificação da saída que o estado descreve. Na execução
+# seguinte só são pontuadas as linhas novas ou alteradas (ou todas, se a configuração mudou
+# ou a saída foi regravada por outro modo); as demais reaproveitam o resultado anterior.
+
+def _state_paths(output_path):
+    output_path = Path(output_path)
+    return (output_path.with_name(output_path.name + ".estado.json"),
+            output_path.with_name(output_path.name + ".hashes.csv"))
+
+
+def _output_signature(output_path):
+    st = os.stat(output_path)
+    return {"tamanho": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def discard_state(output_path):
+    """Apaga o estado incremental de uma saída (usado quando outro modo a regrava)."""
+    for path in _state_paths(output_path):
+        path.unlink(missing_ok=True)
+
+
+def row_hashes(df):
+    """Hash (uint64) do conteúdo de cada linha, independente do índice."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _load_state(output_path):
+    meta_path, hashes_path = _state_paths(output_path)
+    if not (meta_path.exists() and hashes_path.exists() and Path(output_path).exists()):
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        # a saída precisa ser exatamente a gravada junto com este estado
+        if meta.get("saida") != _output_signature(output_path):
+            return None
+        hashes = pd.read_csv(hashes_path, dtype={"id_ocorrencia": str, "row_hash": "uint64"})
+    except Exception:
+        return None
+    return meta, hashes
+
+
+def _save_state(output_path, fingerprint, ids, hashes):
+    meta_path, hashes_path = _state_paths(output_path)
+    pd.DataFrame({"id_ocorrencia": ids, "row_hash": hashes}).to_csv(hashes_path, index=False)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"config_fingerprint": fingerprint, "linhas": len(ids),
+                   "saida": _output_signature(output_path)}, f)
+
+
+def _reusable_rows(df, hashes, output_path, fingerprint):
+    """Posição, na saída anterior, de cada linha que pode ser reaproveitada (-1 = pontuar)."""
+    state = _load_state(output_path)
+    ids = df["id_ocorrencia"].astype(str)
+    if state is None or state[0].get("config_fingerprint") != fingerprint or not ids.is_unique:
+        return None, None
+    _, prev_hashes = state
+    if len(prev_hashes) == 0:
+        # execução anterior sem linhas (ex.: só cabeçalho): tudo é novo
+        return None, None
+
+    prev_index = pd.Index(prev_hashes["id_ocorrencia"])
+    prev = read_table(output_path, ["id_ocorrencia", "score_prioridade"])
+    out_index = pd.Index(prev["id_ocorrencia"].astype(str))
+    if not (prev_index.is_unique and out_index.is_unique):
+        return None, None
+
+    pos_state = prev_index.get_indexer(ids)
+    prev_row_hash = prev_hashes["row_hash"].to_numpy()
+    same = (pos_state >= 0) & (prev_row_hash[np.maximum(pos_state, 0)] == hashes)
+
+    pos_out = np.where(same, out_index.get_indexer(ids), -1)
+    return pos_out, pd.to_numeric(prev["score_prioridade"]).to_numpy()
+
+
+def classify_incremental(input_path, output_path, cfg=DEFAULT_CONFIG, columns=None):
+    """Pontua só as ocorrências novas/alteradas; devolve (resumo, linhas pontuadas, linhas reaproveitadas)."""
+    df = read_table(input_path, columns)
+    fingerprint = config_fingerprint(cfg)
+    hashes = row_hashes(df)
+
+    pos_out = prev_scores = None
+    if "id_ocorrencia" in df.columns:
+        pos_out, prev_scores = _reusable_rows(df, hashes, output_path, fingerprint)
+    if pos_out is None:
+        out = classify_dataframe(df, cfg, copy=False)
+        rescored = len(out)
+    else:
+        # mesma preparação de classify_dataframe, mas só as linhas marcadas são pontuadas
+        _coerce_counts(df)
+        todo = pos_out < 0
+        new_scores = score_dataframe(df[todo], cfg)
+        old_scores = prev_scores[pos_out[~todo]]
+        scores = np.empty(len(df), dtype=np.result_type(new_scores, old_scores))
+        scores[todo] = new_scores
+        scores[~todo] = old_scores
+
+        df["score_prioridade"] = pd.Series(scores, index=df.index)
+        df["prioridade"] = pd.Series(labels_from_scores(scores, cfg), index=df.index)
+        out = df
+        rescored = int(todo.sum())
+
+    write_table(_output_columns(out, columns), output_path)
+    if "id_ocorrencia" in out.columns:
+        _save_state(output_path, fingerprint, out["id_ocorrencia"].astype(str).to_numpy(), hashes)
+    else:
+        discard_state(output_path)
+    resumo = out["prioridade"].value_counts(dropna=False).to_dict()
+    return resumo, rescored, len(out) - rescored
+# ----------------------- FIM MODO INCREMENTAL -----------------------
+
+
 def load_config_from_file(path: Path):
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -234,13 +1051,34 @@ def load_config_from_file(path: Path):
         return DEFAULT_CONFIG
 
 
+USAGE = ("Uso: python classificador_prioridade_crimes.py input.csv [output.csv] [config.json] "
+         "[--chunksize N] [--workers N] [--score-only] [--incremental]")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Classificador de prioridade de ocorrências")
+    parser.add_argument("input_csv", nargs="?")
+    parser.add_argument("output_csv", nargs="?")
+    parser.add_argument("config_json", nargs="?")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="processa o arquivo em blocos de N linhas (memória constante)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="pontua o arquivo em N processos (CSV, uma ocorrência por linha)")
+    parser.add_argument("--score-only", action="store_true",
+                        help="lê só as colunas usadas na pontuação e grava id_ocorrencia + resultado")
+    parser.add_argument("--incremental", action="store_true",
+                        help="pontua só ocorrências novas/alteradas desde a última execução (mesma saída)")
+    return parser.parse_args(argv[1:])
+
+
 def main(argv):
-    if len(argv) < 2:
-        print("Uso: python classificador_prioridade_crimes.py input.csv [output.csv] [config.json]")
+    args = parse_args(argv)
+    if not args.input_csv:
+        print(USAGE)
         return
-    input_csv = Path(argv[1])
-    output_csv = Path(argv[2]) if len(argv) >= 3 else input_csv.with_name(input_csv.stem + "_prioridade.csv")
-    config_file = Path(argv[3]) if len(argv) >= 4 else None
+    input_csv = Path(args.input_csv)
+    output_csv = Path(args.output_csv) if args.output_csv else input_csv.with_name(input_csv.stem + "_prioridade.csv")
+    config_file = Path(args.config_json) if args.config_json else None
 
     if not input_csv.exists():
         print(f"Arquivo não encontrado: {input_csv}")
@@ -251,17 +1089,37 @@ def main(argv):
         cfg = load_config_from_file(config_file)
         print(f"Usando configuração de: {config_file}")
 
-    df = pd.read_csv(input_csv)
-    out = classify_dataframe(df, cfg)
-    out.to_csv(output_csv, index=False)
+    columns = None
+    if args.score_only:
+        columns = [c for c in ["id_ocorrencia"] + SCORE_COLUMNS if c in available_columns(input_csv)]
+
+    csv_only = table_format(input_csv) == "csv" and table_format(output_csv) == "csv" and columns is None
+    if args.workers > 1 and not csv_only and not args.incremental:
+        print("--workers só vale para CSV -> CSV com todas as colunas; usando um processo.")
+
+    if args.incremental:
+        resumo, pontuadas, reaproveitadas = classify_incremental(input_csv, output_csv, cfg, columns)
+        print(f"Incremental: {pontuadas} linhas pontuadas, {reaproveitadas} reaproveitadas")
+    else:
+        # a saída vai ser regravada sem atualizar o estado incremental: ele deixaria de descrevê-la
+        discard_state(output_csv)
+        if args.workers > 1 and csv_only:
+            resumo = classify_csv_parallel(input_csv, output_csv, cfg, args.workers)
+        elif args.chunksize:
+            resumo = classify_streaming(input_csv, output_csv, cfg, args.chunksize, columns)
+        else:
+            out = classify_dataframe(read_table(input_csv, columns), cfg, copy=False)
+            write_table(_output_columns(out, columns), output_csv)
+            resumo = out["prioridade"].value_counts(dropna=False).to_dict()
 
     # resumo simples
-    resumo = out["prioridade"].value_counts(dropna=False).to_dict()
     print("Arquivo salvo em:", output_csv)
     print("Resumo por prioridade:")
     for k, v in resumo.items():
         print(f"  {k}: {v}")
-    
+    cache = LOOKUP_CACHE.stats()
+    if cache["hits"] + cache["misses"]:  # no modo paralelo o cache fica nos processos filhos
+        print(f"Cache de pesos: {cache['hits']} acertos, {cache['misses']} faltas ({cache['size']} entradas)")
 
 
 if __name__ == "__main__":
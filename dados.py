@@ -0,0 +1,220 @@
+# camada de dados do dashboard: carrega datasets e modelos uma vez por processo
+#
+# Os DataFrames e modelos ficam em st.cache_resource e são compartilhados entre todas as sessões,
+# então as páginas devem filtrar/copiar, nunca alterar o DataFrame em si. A chave do cache
+# inclui a data de modificação do arquivo: trocar o CSV faz a próxima execução recarregar.
+
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from espacial import IndiceEspacial
+from eventos import EVENTOS, SEM_EVENTO, processar_eventos, marcar_eventos
+
+ARQUIVO_OCORRENCIAS = "dataset_ocorrencias_delegacia_5(in).csv"
+
+# modelos da página Agrupamento e Priorização
+ARQUIVOS_AGRUPAMENTO = ["models/modelo_kmeans.pkl", "models/preprocessador.pkl", "models/cluster_insights.pkl"]
+
+
+def versao_arquivo(caminho):
+    return os.stat(caminho).st_mtime_ns
+
+
+@st.cache_resource(show_spinner="Carregando ocorrências...", max_entries=2)
+def _carregar_ocorrencias(caminho, versao):
+    t0 = time.perf_counter()
+    df = pd.read_csv(caminho, parse_dates=["data_ocorrencia"])
+
+    # Marcar eventos especiais
+    eventos_proc = processar_eventos(EVENTOS, margem=5)
+    df["evento_especial"] = marcar_eventos(df["data_ocorrencia"], eventos_proc)
+
+    df["ano_mes"] = df["data_ocorrencia"].dt.to_period("M").astype(str)
+    return df, time.perf_counter() - t0
+
+
+def carregar_ocorrencias(caminho=ARQUIVO_OCORRENCIAS):
+    """Ocorrências com evento_especial e ano_mes, compartilhadas entre sessões (somente leitura)."""
+    return _carregar_ocorrencias(caminho, versao_arquivo(caminho))[0]
+
+
+def tempo_carga(caminho=ARQUIVO_OCORRENCIAS):
+    """Segundos gastos na última carga do arquivo (não conta as execuções servidas pelo cache)."""
+    return _carregar_ocorrencias(caminho, versao_arquivo(caminho))[1]
+
+
+class CuboMensal:
+    """Contagens densas ano x bairro x mês x dia x tipo_crime.
+
+    Qualquer recorte da Análise Mensal (mês, e opcionalmente ano e bairro) é um slice seguido
+    de soma nos eixos livres, sem voltar às linhas do DataFrame. Ocorrências sem bairro ficam
+    num bairro extra (contam em "Todos"); sem tipo_crime não entram, como no groupby original.
+    """
+
+    def __init__(self, df):
+        datas = df["data_ocorrencia"]
+        df = df[datas.notna() & df["tipo_crime"].notna()]
+        datas = df["data_ocorrencia"]
+
+        self.anos = list(range(int(datas.dt.year.min()), int(datas.dt.year.max()) + 1)) if len(df) else []
+        cod_bairro, bairros = pd.factorize(df["bairro"], sort=True)
+        cod_crime, crimes = pd.factorize(df["tipo_crime"], sort=True)
+        self.bairros = [str(b) for b in bairros]
+        self.crimes = [str(c) for c in crimes]
+        cod_bairro = np.where(cod_bairro < 0, len(self.bairros), cod_bairro)
+
+        forma = (len(self.anos), len(self.bairros) + 1, 12, 31, len(self.crimes))
+        plano = np.ravel_multi_index(
+            (
+                datas.dt.year.to_numpy() - (self.anos[0] if self.anos else 0),
+                cod_bairro,
+                datas.dt.month.to_numpy() - 1,
+                datas.dt.day.to_numpy() - 1,
+                cod_crime,
+            ),
+            forma,
+        )
+        self.contagens = np.bincount(plano, minlength=int(np.prod(forma))).reshape(forma)
+
+    def dia_crime(self, mes, ano=None, bairro=None):
+        """Matriz 31 x tipo_crime do mês (1-12), somando os anos/bairros não escolhidos."""
+        cubo = self.contagens
+        cubo = cubo if ano is None else cubo[[self.anos.index(ano)]]
+        cubo = cubo if bairro is None else cubo[:, [self.bairros.index(bairro)]]
+        return cubo[:, :, mes - 1].sum(axis=(0, 1))
+
+
+@st.cache_resource(show_spinner="Montando o cubo mensal...", max_entries=2)
+def _cubo_mensal(caminho, versao):
+    return CuboMensal(_carregar_ocorrencias(caminho, versao)[0])
+
+
+def carregar_cubo_mensal(caminho=ARQUIVO_OCORRENCIAS):
+    return _cubo_mensal(caminho, versao_arquivo(caminho))
+
+
+class IndiceHistorico:
+    """Contagem de tipo_crime por (bairro, evento), por bairro e geral, com somas acumuladas no tempo.
+
+    Em cada nível as linhas ficam agrupadas pela chave e ordenadas por data; a contagem de uma
+    chave num intervalo de datas é a diferença entre duas linhas da soma acumulada, achadas por
+    busca binária dentro do trecho da chave.
+    """
+
+    NIVEIS = {"bairro_evento": ["bairro", "evento_especial"], "bairro": ["bairro"], "geral": []}
+
+    def __init__(self, df):
+        df = df[df["data_ocorrencia"].notna()]
+        ts = df["data_ocorrencia"].to_numpy("datetime64[ns]").astype(np.int64)
+        codigos, crimes = pd.factorize(df["tipo_crime"], sort=True)
+        self.crimes = [str(c) for c in crimes]
+        # tipo_crime ausente fica numa coluna extra: conta no total, mas nunca é o mais provável
+        codigos = np.where(codigos < 0, len(self.crimes), codigos)
+        n_cat = len(self.crimes) + 1
+
+        self.niveis = {}
+        for nivel, chaves in self.NIVEIS.items():
+            grupos = df.groupby(chaves, sort=False).indices if chaves else {(): np.arange(len(df))}
+            trechos, ordem, inicio = {}, [], 0
+            for chave, posicoes in grupos.items():
+                posicoes = posicoes[np.argsort(ts[posicoes], kind="stable")]
+                chave = chave if isinstance(chave, tuple) else (chave,)
+                trechos[chave] = (inicio, inicio + len(posicoes))
+                ordem.append(posicoes)
+                inicio += len(posicoes)
+            ordem = np.concatenate(ordem) if ordem else np.empty(0, dtype=np.int64)
+
+            acumulado = np.zeros((len(ordem) + 1, n_cat), dtype=np.int32)
+            acumulado[np.arange(1, len(ordem) + 1), codigos[ordem]] = 1
+            np.cumsum(acumulado, axis=0, out=acumulado)
+            # ordem guarda a posição original de cada linha (para desempatar pela ordem do arquivo)
+            self.niveis[nivel] = (trechos, ts[ordem], acumulado, ordem, codigos[ordem])
+
+    def _janela(self, nivel, chave, inicio, fim):
+        """Linhas [lo, hi) do nível com a chave e inicio <= data <= fim (lo == hi se não houver)."""
+        trechos, ts = self.niveis[nivel][:2]
+        trecho = trechos.get(chave)
+        if trecho is None or inicio > fim:
+            return 0, 0
+        a, b = trecho
+        return a + np.searchsorted(ts[a:b], inicio, side="left"), a + np.searchsorted(ts[a:b], fim, side="right")
+
+    def contar(self, nivel, chave, inicio, fim):
+        """Contagem por tipo_crime (+ ausentes na última posição) da chave com inicio <= data <= fim."""
+        acumulado = self.niveis[nivel][2]
+        lo, hi = self._janela(nivel, chave, inicio, fim)
+        return acumulado[hi] - acumulado[lo]
+
+    def mais_provavel(self, bairro, evento, data, inicio, fim):
+        """(crime mais comum, nº de ocorrências usadas) seguindo a cadeia de fallback da Previsão.
+
+        1. bairro + evento na data; 2. bairro + evento no período (se houver evento);
+        3. bairro no período; 4. todo o período. inicio/fim delimitam o período selecionado.
+        """
+        inicio = np.datetime64(inicio, "ns").astype(np.int64)
+        fim = np.datetime64(fim, "ns").astype(np.int64)
+        dia = np.datetime64(data, "D")
+        dia_ini = max(inicio, dia.astype("datetime64[ns]").astype(np.int64))
+        dia_fim = min(fim, (dia + 1).astype("datetime64[ns]").astype(np.int64) - 1)
+
+        cadeia = [("bairro_evento", (bairro, evento), dia_ini, dia_fim)]
+        if evento != SEM_EVENTO:
+            cadeia.append(("bairro_evento", (bairro, evento), inicio, fim))
+        cadeia += [("bairro", (bairro,), inicio, fim), ("geral", (), inicio, fim)]
+
+        for nivel, chave, a, b in cadeia:
+            _, _, acumulado, ordem, codigos = self.niveis[nivel]
+            lo, hi = self._janela(nivel, chave, a, b)
+            contagens = acumulado[hi] - acumulado[lo]
+            total = int(contagens.sum())
+            if total:
+                crimes = contagens[:-1]
+                if not crimes.any():
+                    return None, total
+                empatados = np.flatnonzero(crimes == crimes.max())
+                if len(empatados) == 1:
+                    return self.crimes[int(empatados[0])], total
+                # empate: como no value_counts().idxmax(), vence o que aparece primeiro no arquivo
+                # entre as linhas da janela (que aqui estão ordenadas por data, não pela posição)
+                sel = np.isin(codigos[lo:hi], empatados)
+                return self.crimes[int(codigos[lo:hi][sel][ordem[lo:hi][sel].argmin()])], total
+        return None, 0
+
+
+@st.cache_resource(show_spinner="Indexando histórico...", max_entries=2)
+def _indice_historico(caminho, versao):
+    return IndiceHistorico(_carregar_ocorrencias(caminho, versao)[0])
+
+
+def carregar_indice_historico(caminho=ARQUIVO_OCORRENCIAS):
+    return _indice_historico(caminho, versao_arquivo(caminho))
+
+
+@st.cache_resource(show_spinner="Indexando coordenadas...", max_entries=2)
+def _indice_espacial(caminho, versao):
+    df = _carregar_ocorrencias(caminho, versao)[0]
+    return IndiceEspacial(df["latitude"], df["longitude"])
+
+
+def carregar_indice_espacial(caminho=ARQUIVO_OCORRENCIAS):
+    """Índice em grade sobre latitude/longitude; os índices apontam para as linhas de carregar_ocorrencias()."""
+    return _indice_espacial(caminho, versao_arquivo(caminho))
+
+
+@st.cache_resource(show_spinner="Carregando modelos de agrupamento...", max_entries=2)
+def _carregar_modelos(caminhos, versoes):
+    return tuple(joblib.load(caminho) for caminho in caminhos)
+
+
+def carregar_modelos_agrupamento():
+    """(kmeans, preprocessor, cluster_insights), compartilhados entre sessões.
+
+    Erros de carga não ficam em cache: a próxima execução tenta de novo.
+    """
+    caminhos = tuple(ARQUIVOS_AGRUPAMENTO)
+    return _carregar_modelos(caminhos, tuple(versao_arquivo(c) for c in caminhos))
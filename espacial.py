@@ -0,0 +1,138 @@
+# agregação espacial das ocorrências para os mapas do dashboard
+
+import numpy as np
+import pandas as pd
+
+# ~1 grau de latitude em metros (usado para converter o tamanho das células)
+METROS_POR_GRAU = 111_320.0
+
+
+def peso_por_frequencia(categorias):
+    """Peso de cada linha = frequência da sua categoria no conjunto / maior frequência (0 a 1)."""
+    categorias = pd.Series(categorias)
+    freq = categorias.map(categorias.value_counts()).astype(float)
+    return freq / freq.max()
+
+
+def agregar_grade(latitude, longitude, pesos=None, tamanho_m=500):
+    """Agrupa pontos em células quadradas de ~tamanho_m metros.
+
+    Retorna um DataFrame com o centro de cada célula (latitude/longitude), a quantidade de
+    ocorrências e a soma dos pesos normalizada para 0..1. Pontos sem coordenada são ignorados.
+    """
+    lat = np.asarray(latitude, dtype=np.float64)
+    lon = np.asarray(longitude, dtype=np.float64)
+    pesos = np.ones(len(lat)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+    validas = np.isfinite(lat) & np.isfinite(lon)
+    lat, lon, pesos = lat[validas], lon[validas], pesos[validas]
+    if len(lat) == 0:
+        return pd.DataFrame({"latitude": [], "longitude": [], "quantidade": [], "peso": []})
+
+    passo = tamanho_m / METROS_POR_GRAU
+    i = np.floor(lat / passo).astype(np.int64)
+    j = np.floor(lon / passo).astype(np.int64)
+    i0, j0 = i.min(), j.min()
+    largura = j.max() - j0 + 1
+    chaves, inverso = np.unique((i - i0) * largura + (j - j0), return_inverse=True)
+
+    quantidade = np.bincount(inverso, minlength=len(chaves))
+    soma = np.bincount(inverso, weights=pesos, minlength=len(chaves))
+    ci, cj = chaves // largura + i0, chaves % largura + j0
+    return pd.DataFrame({
+        "latitude": np.round((ci + 0.5) * passo, 6),
+        "longitude": np.round((cj + 0.5) * passo, 6),
+        "quantidade": quantidade,
+        "peso": np.round(soma / soma.max(), 4),
+    })
+
+
+# raio médio da Terra em metros
+RAIO_TERRA_M = 6_371_008.8
+
+
+def haversine(lat, lon, lats, lons):
+    """Distância em metros de (lat, lon) até cada ponto de (lats, lons)."""
+    lat, lon = np.radians(lat), np.radians(lon)
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = np.sin((lats - lat) / 2) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * RAIO_TERRA_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class IndiceEspacial:
+    """Grade (hash por célula em graus) sobre latitude/longitude, com refinamento por haversine.
+
+    Os pontos ficam ordenados pela chave da célula; cada linha da grade que cruza a caixa da
+    consulta vira um intervalo contíguo nesse vetor, achado por busca binária. Os índices
+    devolvidos são posições nas colunas originais (pontos sem coordenada são ignorados).
+    """
+
+    def __init__(self, latitude, longitude, tamanho_celula_m=250):
+        lat = np.asarray(latitude, dtype=np.float64)
+        lon = np.asarray(longitude, dtype=np.float64)
+        validas = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+        self.passo = tamanho_celula_m / METROS_POR_GRAU
+        self.n = len(validas)
+
+        i = np.floor(lat[validas] / self.passo).astype(np.int64)
+        j = np.floor(lon[validas] / self.passo).astype(np.int64)
+        self.i0 = int(i.min()) if self.n else 0
+        self.j0 = int(j.min()) if self.n else 0
+        self.linhas = int(i.max()) - self.i0 + 1 if self.n else 0
+        self.largura = int(j.max()) - self.j0 + 1 if self.n else 0
+
+        chaves = (i - self.i0) * self.largura + (j - self.j0)
+        ordem = np.argsort(chaves, kind="stable")
+        self.chaves = chaves[ordem]
+        self.posicoes = validas[ordem]
+        self.lat = lat[self.posicoes]
+        self.lon = lon[self.posicoes]
+
+    def _candidatos(self, lat, lon, raio_m):
+        # caixa em graus que contém o círculo (a longitude se estica com a latitude)
+        dlat = raio_m / METROS_POR_GRAU
+        cos_lat = np.cos(np.radians(min(abs(lat) + dlat, 90.0)))
+        dlon = 360.0 if cos_lat < 1e-9 else dlat / cos_lat
+        ia = max(int(np.floor((lat - dlat) / self.passo)) - self.i0, 0)
+        ib = min(int(np.floor((lat + dlat) / self.passo)) - self.i0, self.linhas - 1)
+        ja = max(int(np.floor((lon - dlon) / self.passo)) - self.j0, 0)
+        jb = min(int(np.floor((lon + dlon) / self.passo)) - self.j0, self.largura - 1)
+        if ia > ib or ja > jb:
+            return np.empty(0, dtype=np.int64)
+
+        linhas = np.arange(ia, ib + 1, dtype=np.int64) * self.largura
+        lo = np.searchsorted(self.chaves, linhas + ja, side="left")
+        hi = np.searchsorted(self.chaves, linhas + jb, side="right")
+        tamanhos = hi - lo
+        if tamanhos.sum() == 0:
+            return np.empty(0, dtype=np.int64)
+        # concatena os intervalos [lo, hi) sem laço em Python
+        inicio = np.repeat(lo - np.cumsum(tamanhos) + tamanhos, tamanhos)
+        return inicio + np.arange(tamanhos.sum())
+
+    def raio(self, lat, lon, raio_m, filtro=None):
+        """(índices, distâncias em metros) dos pontos a até raio_m, do mais próximo ao mais distante.
+
+        filtro: vetor booleano opcional sobre as linhas originais (ex.: mesmo tipo de crime).
+        """
+        cand = self._candidatos(lat, lon, raio_m)
+        if filtro is not None:
+            cand = cand[np.asarray(filtro)[self.posicoes[cand]]]
+        dist = haversine(lat, lon, self.lat[cand], self.lon[cand])
+        dentro = dist <= raio_m
+        cand, dist = cand[dentro], dist[dentro]
+        ordem = np.argsort(dist, kind="stable")
+        return self.posicoes[cand[ordem]], dist[ordem]
+
+    def vizinhos(self, lat, lon, k=10, filtro=None):
+        """(índices, distâncias) dos k pontos mais próximos (exato: o raio dobra até achar k)."""
+        total = self.n if filtro is None else int(np.asarray(filtro)[self.posicoes].sum())
+        k = min(k, total)
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        # a busca por raio é exata, então os k mais próximos estão no primeiro raio com >= k pontos
+        raio_m = self.passo * METROS_POR_GRAU
+        while True:
+            idx, dist = self.raio(lat, lon, raio_m, filtro)
+            if len(idx) >= k or raio_m > np.pi * RAIO_TERRA_M:
+                return idx[:k], dist[:k]
+            raio_m *= 2
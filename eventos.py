@@ -0,0 +1,69 @@
+# eventos especiais da cidade, usados para marcar as ocorrências (dashboard e backend)
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+EVENTOS = [
+    {"nome": "Carnaval", "data": "20-02-2024"},
+    {"nome": "Recife Junino (Sítio Trindade)", "data": "11-06-2024 a 30-06-2024"},
+    {"nome": "Festival de Quadrilhas Juninas do Nordeste", "data": "22-06-2024"},
+    {"nome": "Festa de Nossa Senhora do Carmo", "data": "06-07-2024 a 16-07-2024"},
+    {"nome": "Samba Recife", "data": "28-09-2024 a 29-09-2024"},
+    {"nome": "Phase Festival (música eletrônica)", "data": "09-11-2024"},
+    {"nome": "Réveillon (Orla da Praia do Pina)", "data": "29-12-2024 a 31-12-2024"}
+]
+
+# rótulo das ocorrências fora de qualquer evento
+SEM_EVENTO = "Normal"
+
+
+def processar_eventos(eventos, margem=5):
+    eventos_processados = []
+    for ev in eventos:
+        if " a " in ev["data"]:
+            inicio_str, fim_str = ev["data"].split(" a ")
+            inicio = datetime.strptime(inicio_str, "%d-%m-%Y").date()
+            fim = datetime.strptime(fim_str, "%d-%m-%Y").date()
+        else:
+            data = datetime.strptime(ev["data"], "%d-%m-%Y").date()
+            inicio, fim = data, data
+        inicio -= timedelta(days=margem)
+        fim += timedelta(days=margem)
+        eventos_processados.append({"nome": ev["nome"], "inicio": inicio, "fim": fim})
+    return eventos_processados
+
+
+def tabela_eventos(eventos_proc):
+    """(primeiro dia, vetor dia -> índice do evento) cobrindo do início do primeiro ao fim do último evento.
+
+    Dias sem evento ficam com -1. Em janelas sobrepostas vale o evento que aparece primeiro na lista.
+    """
+    inicio = np.datetime64(min(ev["inicio"] for ev in eventos_proc), "D")
+    fim = np.datetime64(max(ev["fim"] for ev in eventos_proc), "D")
+    tabela = np.full((fim - inicio).astype(np.int64) + 1, -1, dtype=np.int32)
+    # preenche de trás para frente: os eventos do começo da lista sobrescrevem os seguintes
+    for k in range(len(eventos_proc) - 1, -1, -1):
+        a = (np.datetime64(eventos_proc[k]["inicio"], "D") - inicio).astype(np.int64)
+        b = (np.datetime64(eventos_proc[k]["fim"], "D") - inicio).astype(np.int64)
+        tabela[a:b + 1] = k
+    return inicio, tabela
+
+
+def marcar_eventos(datas, eventos_proc):
+    """Nome do evento de cada data (o primeiro da lista que a contém) ou SEM_EVENTO."""
+    datas = pd.to_datetime(pd.Series(datas), errors="coerce")
+    rotulos = np.full(len(datas), SEM_EVENTO, dtype=object)
+    if eventos_proc:
+        inicio, tabela = tabela_eventos(eventos_proc)
+        dias = datas.to_numpy().astype("datetime64[D]")
+        pos = (dias - inicio).astype(np.int64)
+        dentro = ~np.isnat(dias) & (pos >= 0) & (pos < len(tabela))
+        codigos = np.full(len(datas), -1, dtype=np.int32)
+        codigos[dentro] = tabela[pos[dentro]]
+        com_evento = codigos >= 0
+        nomes = np.array([ev["nome"] for ev in eventos_proc], dtype=object)
+        rotulos[com_evento] = nomes[codigos[com_evento]]
+    # mesmo dtype de uma coluna de texto criada com df[col] = "Normal"
+    return pd.Series(rotulos, index=datas.index).astype(str)
@@ -0,0 +1,163 @@
+# Página Agrupamento e Priorização (Clustering + Prioridade)
+
+import streamlit as st
+import pandas as pd
+
+from calssificar import DEFAULT_CONFIG, score_row, score_to_label
+from dados import carregar_ocorrencias, carregar_modelos_agrupamento, carregar_indice_espacial
+
+# quantos casos semelhantes (mesmo tipo de crime) mostrar na busca por proximidade
+K_SEMELHANTES = 10
+
+
+def render():
+    st.title("🔍 Análise de Agrupamento e Priorização de Ocorrências")
+
+    df = carregar_ocorrencias()
+
+    # Carregamento dos modelos de clustering (uma vez por processo, ver dados.py)
+    try:
+        kmeans, preprocessor, cluster_insights = carregar_modelos_agrupamento()
+        modelo_carregado = True
+    except Exception as e:
+        st.error(f"Erro ao carregar os modelos: {e}")
+        modelo_carregado = False
+
+    if modelo_carregado:
+        st.subheader("Insira os dados da nova ocorrência:")
+
+        with st.form("form_cluster"):
+            col1, col2 = st.columns(2)
+
+            descricao = col1.text_area("Descrição do modus operandi", "")
+            bairro = col1.selectbox("Bairro", sorted(df["bairro"].dropna().unique().tolist()))
+            tipo_crime = col1.selectbox("Tipo de crime", sorted(df["tipo_crime"].dropna().unique().tolist()))
+            arma = col2.selectbox("Arma utilizada", sorted(df["arma_utilizada"].dropna().unique().tolist()))
+            sexo_suspeito = col2.selectbox("Sexo do suspeito", ["Masculino", "Feminino", "Não informado"])
+            idade_suspeito = col2.number_input("Idade do suspeito", min_value=10, max_value=90, value=25)
+            qtd_vitimas = col1.number_input("Quantidade de vítimas", min_value=0, value=1)
+            qtd_suspeitos = col1.number_input("Quantidade de suspeitos", min_value=1, value=1)
+            data_input = col1.date_input("Data da ocorrência", value=pd.Timestamp.now().date())
+            hora_input = col2.time_input("Hora da ocorrência", value=pd.Timestamp.now().time())
+            latitude = col1.number_input("Latitude", value=None, format="%.6f", placeholder="centro do bairro")
+            longitude = col2.number_input("Longitude", value=None, format="%.6f", placeholder="centro do bairro")
+            raio_busca = col2.number_input("Raio para ocorrências próximas (m)", min_value=50, max_value=20_000,
+                                           value=500, step=50)
+
+            submit_cluster = st.form_submit_button("Classificar Ocorrência")
+
+        if submit_cluster:
+            data_ocorrencia_input = pd.to_datetime(f"{data_input} {hora_input}")
+            nova_ocorrencia = pd.DataFrame([{
+                "descricao_modus_operandi": descricao,
+                "bairro": bairro,
+                "tipo_crime": tipo_crime,
+                "arma_utilizada": arma,
+                "sexo_suspeito": sexo_suspeito,
+                "quantidade_vitimas": qtd_vitimas,
+                "quantidade_suspeitos": qtd_suspeitos,
+                "idade_suspeito": idade_suspeito,
+                "data_ocorrencia": data_ocorrencia_input
+            }])
+
+            # -----------------------
+            # Processamento para Clustering
+            # -----------------------
+            # Extrai colunas temporais (ano, mês, dia, hora)
+            nova_ocorrencia["ano"] = nova_ocorrencia["data_ocorrencia"].dt.year
+            nova_ocorrencia["mes"] = nova_ocorrencia["data_ocorrencia"].dt.month
+            nova_ocorrencia["dia"] = nova_ocorrencia["data_ocorrencia"].dt.day
+            nova_ocorrencia["hora"] = nova_ocorrencia["data_ocorrencia"].dt.hour
+
+            # Remove a coluna original de data
+            nova_ocorrencia_cluster = nova_ocorrencia.drop(columns=["data_ocorrencia"])
+
+            try:
+                # Aplica o mesmo pré-processamento do treino
+                X_proc = preprocessor.transform(nova_ocorrencia_cluster)
+
+                # Prediz o cluster
+                cluster_pred = int(kmeans.predict(X_proc)[0])
+
+                # Exibe o resultado do clustering
+                st.success(f"A ocorrência pertence ao **Cluster {cluster_pred}**")
+
+                # Exibe insights do cluster, se disponíveis
+                if cluster_insights and cluster_pred in cluster_insights:
+                    info = cluster_insights[cluster_pred]
+                    st.markdown(f"""
+                    ### Características do Cluster {cluster_pred}
+                    - **Crimes predominantes:** {', '.join(info['tipos_crime'])}
+                    - **Bairros mais frequentes:** {', '.join(info['bairros'])}
+                    - **Faixa etária média dos suspeitos:** {info['idade_media']} anos
+                    - **Sexo predominante:** {info['sexo_predominante']}
+                    - **Armas mais usadas:** {', '.join(info['armas'])}
+                    """)
+
+                    st.info(info["descricao_textual"])
+
+            except Exception as e:
+                st.error(f"Erro ao processar a ocorrência para clustering: {e}")
+
+            # -----------------------
+            # Processamento para Priorização
+            # -----------------------
+            # Calcula score e prioridade usando as funções do classificador (calssificar.py)
+            cfg = DEFAULT_CONFIG
+            row = nova_ocorrencia.iloc[0]
+            score = score_row(row, cfg)
+            prioridade = score_to_label(score, cfg)
+
+            # Mapeamento de cores para cada prioridade
+            cor_prioridade = {
+                "Muito Alta": "background-color: #FF4C4C; color: white",
+                "Alta": "background-color: #FF8C42; color: white",
+                "Média": "background-color: #FFD166; color: black",
+                "Baixa": "background-color: #06D6A0; color: black"
+            }
+
+            cor = cor_prioridade.get(prioridade, "")
+
+            # Exibe em formato de cartão estilizado
+            st.subheader("🔎 Detalhes e Prioridade da Ocorrência")
+            st.markdown(
+                f"""
+                <div style="padding:16px; border-radius:10px; {cor}">
+                    <p><b>Data:</b> {row["data_ocorrencia"]}</p>
+                    <p><b>Bairro:</b> {row.get("bairro", "")}</p>
+                    <p><b>Tipo de crime:</b> {row.get("tipo_crime", "")}</p>
+                    <p><b>Vítimas:</b> {row.get("quantidade_vitimas", "")}</p>
+                    <p><b>Suspeitos:</b> {row.get("quantidade_suspeitos", "")}</p>
+                    <p><b>Sexo suspeito:</b> {row.get("sexo_suspeito", "")}</p>
+                    <p><b>Idade suspeito:</b> {row.get("idade_suspeito", "")}</p>
+                    <p><b>Score prioridade:</b> {score}</p>
+                    <p><b>Prioridade:</b> {prioridade}</p>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+            # -----------------------
+            # Ocorrências próximas (índice espacial)
+            # -----------------------
+            st.subheader("📍 Ocorrências Próximas")
+            if latitude is None or longitude is None:
+                # sem coordenada informada, usa o centro (mediana) das ocorrências do bairro
+                do_bairro = df[df["bairro"] == bairro]
+                latitude, longitude = do_bairro["latitude"].median(), do_bairro["longitude"].median()
+                st.caption(f"Local não informado: usando o centro de {bairro} ({latitude:.5f}, {longitude:.5f}).")
+
+            indice = carregar_indice_espacial()
+            idx_raio, _ = indice.raio(latitude, longitude, raio_busca)
+            idx_sem, dist_sem = indice.vizinhos(latitude, longitude, K_SEMELHANTES,
+                                                filtro=(df["tipo_crime"] == tipo_crime).to_numpy())
+
+            st.metric(f"Ocorrências a até {raio_busca} m", len(idx_raio))
+            semelhantes = df.iloc[idx_sem][["id_ocorrencia", "data_ocorrencia", "bairro", "tipo_crime",
+                                            "arma_utilizada", "status_investigacao"]].copy()
+            semelhantes.insert(0, "distancia_m", dist_sem.round(0))
+            st.markdown(f"**{len(semelhantes)} casos de {tipo_crime} mais próximos**")
+            st.dataframe(semelhantes, use_container_width=True, hide_index=True)
+
+    else:
+        st.warning("⚠️ Modelos de agrupamento não foram carregados corretamente.")
@@ -0,0 +1,61 @@
+# Página Análise Mensal
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from dados import carregar_cubo_mensal
+
+
+def render():
+    st.title("📈 Análise de Crimes por Mês")
+
+    # contagens ano x bairro x mês x dia x crime, montadas uma vez por versão do CSV
+    cubo = carregar_cubo_mensal()
+
+    # Lista de meses
+    meses = [
+        "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+        "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+    ]
+    col1, col2, col3 = st.columns(3)
+    mes_selecionado = col1.selectbox("Selecione o mês:", meses)
+    num_mes = meses.index(mes_selecionado) + 1  # Janeiro = 1
+    ano_selecionado = col2.selectbox("Ano:", ["Todos"] + cubo.anos)
+    bairro_selecionado = col3.selectbox("Bairro:", ["Todos"] + cubo.bairros)
+
+    # Conta ocorrências por dia e tipo de crime (slice do cubo)
+    tabela = cubo.dia_crime(
+        num_mes,
+        None if ano_selecionado == "Todos" else ano_selecionado,
+        None if bairro_selecionado == "Todos" else bairro_selecionado,
+    )
+    dias, crimes = np.nonzero(tabela)
+    df_agg = pd.DataFrame({
+        "dia": dias + 1,
+        "tipo_crime": np.array(cubo.crimes, dtype=object)[crimes],
+        "quantidade": tabela[dias, crimes],
+    })
+
+    # Ordena os crimes do mais comum para o menos comum dentro do mês
+    totais = tabela.sum(axis=0)
+    top_crimes = [cubo.crimes[j] for j in np.argsort(-totais, kind="stable") if totais[j] > 0]
+    df_agg["tipo_crime"] = pd.Categorical(df_agg["tipo_crime"], categories=top_crimes, ordered=True)
+
+    periodo = "todos os anos" if ano_selecionado == "Todos" else ano_selecionado
+    if bairro_selecionado != "Todos":
+        periodo = f"{periodo}, {bairro_selecionado}"
+
+    # Cria gráfico de linhas
+    fig_crimes = px.line(
+        df_agg,
+        x="dia",
+        y="quantidade",
+        color="tipo_crime",
+        title=f"Crimes mais comuns em {mes_selecionado} ({periodo})",
+        labels={"dia": "Dia do mês", "quantidade": "Ocorrências", "tipo_crime": "Tipo de crime"},
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+
+    st.plotly_chart(fig_crimes, use_container_width=True)
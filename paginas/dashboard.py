@@ -0,0 +1,69 @@
+# Página Dashboard
+
+import streamlit as st
+import plotly.express as px
+
+from dados import carregar_ocorrencias
+
+
+def render():
+    st.title("📊 Dashboard Interativo de Ocorrências Criminais")
+
+    df = carregar_ocorrencias()
+
+    # Filtro por período
+    min_date = df["data_ocorrencia"].min()
+    max_date = df["data_ocorrencia"].max()
+
+    data_range = st.slider(
+        "Selecione o período:",
+        min_value=min_date.to_pydatetime(),
+        max_value=max_date.to_pydatetime(),
+        value=(min_date.to_pydatetime(), max_date.to_pydatetime())
+    )
+
+    df_filtrado = df[(df["data_ocorrencia"] >= data_range[0]) & (df["data_ocorrencia"] <= data_range[1])]
+
+    col1, col2 = st.columns(2)
+
+    # Top 10 bairros
+    bairros = df_filtrado['bairro'].value_counts().head(10).reset_index()
+    bairros.columns = ["bairro", "quantidade"]
+    fig_bairros = px.bar(
+        bairros,
+        x="bairro",
+        y="quantidade",
+        title="Top 10 Bairros com Mais Ocorrências",
+        labels={"bairro": "Bairro", "quantidade": "Quantidade"},
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+    col1.plotly_chart(fig_bairros, use_container_width=True)
+
+    # Ocorrências por evento especial
+    contagem_evento = df_filtrado["evento_especial"].value_counts().reset_index()
+    contagem_evento.columns = ["evento", "quantidade"]
+    fig_eventos = px.bar(
+        contagem_evento,
+        x="evento",
+        y="quantidade",
+        title="Ocorrências por Evento Especial (±5 dias)",
+        labels={"evento": "Evento", "quantidade": "Quantidade"},
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+    col2.plotly_chart(fig_eventos, use_container_width=True)
+
+    # Evolução mensal
+    ocorrencias_mes = df_filtrado.groupby("ano_mes").size().reset_index(name="quantidade")
+    fig_tempo = px.line(
+        ocorrencias_mes,
+        x="ano_mes",
+        y="quantidade",
+        markers=True,
+        title="Evolução de Ocorrências por Mês",
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+    st.plotly_chart(fig_tempo, use_container_width=True)
+
+    # Tabela interativa
+    st.subheader("📑 Dados Filtrados")
+    st.dataframe(df_filtrado, use_container_width=True)
@@ -0,0 +1,49 @@
+# Página Home: Sobre o Projeto
+
+import streamlit as st
+
+
+def render():
+    st.title("Bem-vindo ao Sistema de Suporte à Investigação Criminal")
+
+    st.markdown("""
+    ### Problema
+    O estado de Pernambuco enfrenta altos índices de criminalidade, sendo o líder em taxa de homicídios no Brasil em 2024, com aproximadamente 37.8 homicídios por 100.000 habitantes, resultando em mais de 3.300 homicídios registrados. No contexto nacional, o Brasil registrou cerca de 18.21 homicídios por 100.000 habitantes, mas regiões como o Nordeste, incluindo Pernambuco, apresentam taxas significativamente mais altas. Problemas específicos incluem:
+    - Aumento de crimes violentos como latrocínios, feminicídios e roubos.
+    - Dificuldade na alocação eficiente de recursos policiais por delegacias e bairros.
+    - Necessidade de identificação de padrões criminais para prevenção e investigação mais ágeis.
+
+    Estatísticas reais (fontes: Statista, Wikipedia, InSight Crime):
+    - Pernambuco: 37.8 homicídios/100k habitantes (2024).
+    - Brasil: Quase 45.000 assassinatos totais em 2024, incluindo homicídios e feminicídios.
+    - Foco em violência organizada e impactos climáticos que influenciam padrões criminais.
+
+    **Perguntas-chave:**
+    - Onde e quando há maior risco de ocorrências criminais?
+    - Quais as similaridades entre as ocorrências e a qual grupo ela pertence? (modus operandi, local, tempo)?
+
+    ### Nossa Solução
+    Desenvolvemos um protótipo funcional (PoC) baseado em Machine Learning para classificar e prever padrões criminais, correlacionar ocorrências e gerar insights visuais. Público-alvo: Equipes de investigação da Polícia Civil de Pernambuco (PC-PE) e setores de inteligência.
+
+    **Foco em Aprendizagem Supervisionada:**
+    - MVP que resolve classificação de agrupamento (ex.: A qual grupo esse crime pertence) e previsão (ex.: probabilidade em janelas de tempo por região).
+    - Inclui data storytelling, pipeline de pré-processamento, avaliação quantitativa e justificativa de modelos.
+
+    ### Metodologia
+    Aplicamos uma abordagem estruturada, priorizando a metodologia sobre a qualidade intrínseca dos dados:
+    1. **Definição do Problema:** Baseado em estatísticas reais do mundo (não apenas dados internos) para defender a problemática.
+    2. **História de Dados (Data Storytelling):** Contexto, perguntas-chave, visões exploratórias (distribuições, séries temporais, mapas de calor).
+    3. **Pipeline de Dados:** Limpeza, encoding, split temporal (evitando vazamento).
+    4. **Modelagem:** Clusterização (Kmeans) + Modelos (Random Forest, XGBoost). Usamos técnica de cotovelo para clusters ideais (ex.: 3 clusters).
+    5. **Métricas:** Precision, ROC-AUC, Matriz de Confusão.
+    6. **Interpretação:** Importância de features (SHAP), análise de erros.
+    7. **Justificativa:** Escolha baseada em desempenho, interpretabilidade e custo.
+    8. **Visualizações:** Dashboards interativos com mapas, gráficos e tabelas.
+
+    **Requisitos Não Funcionais:**
+    - Conformidade com LGPD: Anonimização de dados (sem PII).
+    - Reprodutibilidade: requirements.txt.
+    - Organização do Repositório: /models, /backend.
+
+    Esta aplicação é deployada no Streamlit Cloud para atualizações automáticas via repositório GitHub.
+    """)
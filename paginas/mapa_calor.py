@@ -0,0 +1,120 @@
+# Página Mapa de Calor
+
+import streamlit as st
+import pydeck as pdk
+
+import dados
+from dados import carregar_ocorrencias
+from espacial import agregar_grade, peso_por_frequencia
+
+# tamanhos de célula oferecidos no modo agregado (metros)
+TAMANHOS_CELULA = [250, 500, 1000, 2000]
+
+
+def filtrar(df, inicio, fim, bairro, tipo_crime):
+    df = df[(df["data_ocorrencia"] >= inicio) & (df["data_ocorrencia"] <= fim)]
+    if bairro != "Todos":
+        df = df[df["bairro"] == bairro]
+    if tipo_crime != "Todos":
+        df = df[df["tipo_crime"] == tipo_crime]
+    return df
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def celulas(versao, inicio, fim, bairro, tipo_crime, tamanho_m):
+    # versao (mtime do CSV) entra na chave para invalidar junto com os dados
+    df_heat = filtrar(carregar_ocorrencias(), inicio, fim, bairro, tipo_crime)
+    pesos = peso_por_frequencia(df_heat["tipo_crime"]) if len(df_heat) else None
+    return agregar_grade(df_heat["latitude"], df_heat["longitude"], pesos, tamanho_m)
+
+
+def render():
+    st.title("🌍 Mapa de Calor das Ocorrências")
+
+    df = carregar_ocorrencias()
+
+    # Filtro por período (reutilizando)
+    min_date = df["data_ocorrencia"].min()
+    max_date = df["data_ocorrencia"].max()
+    data_range = st.slider(
+        "Selecione o período:",
+        min_value=min_date.to_pydatetime(),
+        max_value=max_date.to_pydatetime(),
+        value=(min_date.to_pydatetime(), max_date.to_pydatetime())
+    )
+    df_filtrado = df[(df["data_ocorrencia"] >= data_range[0]) & (df["data_ocorrencia"] <= data_range[1])]
+
+    col1, col2 = st.columns(2)
+
+    # Lista de bairros e crimes com opção "Todos"
+    bairros_disponiveis = ["Todos"] + sorted(df_filtrado["bairro"].dropna().unique().tolist())
+    bairro_selecionado = col1.selectbox("Selecione o bairro:", bairros_disponiveis)
+    crimes_disponiveis = ["Todos"] + sorted(df_filtrado["tipo_crime"].dropna().unique().tolist())
+    crime_selecionado = col2.selectbox("Tipo de crime:", crimes_disponiveis)
+
+    # agregado: só as células da grade vão para o navegador; pontos: uma linha por ocorrência
+    modo = col1.radio("Modo", ["Agregado (grade)", "Pontos individuais"], horizontal=True)
+    tamanho_m = col2.select_slider("Tamanho da célula (m)", TAMANHOS_CELULA, value=500,
+                                   disabled=modo != "Agregado (grade)")
+
+    if modo == "Agregado (grade)":
+        df_heat = celulas(dados.versao_arquivo(dados.ARQUIVO_OCORRENCIAS), data_range[0], data_range[1],
+                          bairro_selecionado, crime_selecionado, tamanho_m)
+        total = int(df_heat["quantidade"].sum())
+        tooltip = {"text": "Ocorrências: {quantidade}\nPeso: {peso}"}
+        raio_pontos = "quantidade * 20 + 40"
+    else:
+        df_heat = filtrar(df, data_range[0], data_range[1], bairro_selecionado, crime_selecionado)
+        df_heat = df_heat[["latitude", "longitude", "bairro", "tipo_crime", "data_ocorrencia"]].copy()
+        df_heat["data_ocorrencia"] = df_heat["data_ocorrencia"].astype(str)
+        # Normaliza a frequência de cada tipo de crime para criar o peso do heatmap (0 a 1)
+        df_heat["peso"] = peso_por_frequencia(df_heat["tipo_crime"]) if len(df_heat) else []
+        total = len(df_heat)
+        tooltip = {"text": "Bairro: {bairro}\nCrime: {tipo_crime}\nData: {data_ocorrencia}"}
+        raio_pontos = 40
+
+    if len(df_heat) == 0:
+        st.warning("Não há ocorrências para o bairro selecionado.")
+    else:
+        # Ajusta radiusPixels dinamicamente para não extrapolar o bairro
+        raio = max(10, min(40, total))  # mínimo 10, máximo 40
+
+        heatmap_layer = pdk.Layer(
+            "HeatmapLayer",
+            data=df_heat,
+            get_position="[longitude, latitude]",
+            get_weight="peso",
+            radiusPixels=raio,
+            intensity=1,
+            threshold=0.01,
+            get_color="[255 * peso, 0, 0, 160]"  # vermelho mais intenso para crimes mais comuns
+        )
+
+        # Scatter de pontos (no modo agregado, um círculo por célula)
+        scatter_layer = pdk.Layer(
+            "ScatterplotLayer",
+            data=df_heat,
+            get_position="[longitude, latitude]",
+            get_color="[200, 30, 0, 160]",
+            get_radius=raio_pontos,
+            pickable=True,
+        )
+
+        # Centraliza o mapa no bairro selecionado
+        view_state = pdk.ViewState(
+            latitude=df_heat["latitude"].mean(),
+            longitude=df_heat["longitude"].mean(),
+            zoom=11,
+            pitch=40,
+        )
+
+        deck = pdk.Deck(
+            layers=[heatmap_layer, scatter_layer],
+            initial_view_state=view_state,
+            tooltip=tooltip
+        )
+
+        st.pydeck_chart(deck)
+
+        payload_kb = len(deck.to_json().encode("utf-8")) / 1024
+        st.caption(f"{total} ocorrências em {len(df_heat)} pontos enviados ao mapa · payload {payload_kb:.1f} KB")
@@ -0,0 +1,87 @@
+# Página Previsão de Crimes
+
+import streamlit as st
+import requests
+import os
+
+from dados import carregar_ocorrencias, carregar_indice_historico
+
+
+def render():
+    st.title("🕵️ Previsão de Crime Mais Provável")
+
+    df = carregar_ocorrencias()
+
+    API_URL = os.getenv("API_URL", "http://127.0.0.1:8000/predict")
+
+    # Filtro por período (reutilizando para consistência)
+    min_date = df["data_ocorrencia"].min()
+    max_date = df["data_ocorrencia"].max()
+    data_range = st.slider(
+        "Selecione o período histórico para base da previsão:",
+        min_value=min_date.to_pydatetime(),
+        max_value=max_date.to_pydatetime(),
+        value=(min_date.to_pydatetime(), max_date.to_pydatetime())
+    )
+    df_filtrado = df[(df["data_ocorrencia"] >= data_range[0]) & (df["data_ocorrencia"] <= data_range[1])]
+
+    with st.form(key="prever_crime_form"):
+        col1, col2 = st.columns(2)
+
+        data_input = col1.date_input("Data da Previsão")
+        bairro_input = col1.selectbox("Bairro", [""] + sorted(df_filtrado["bairro"].dropna().unique().tolist()))
+        evento_input = col2.selectbox("Evento", ["Normal"] + sorted(set(df_filtrado["evento_especial"].dropna())))
+
+        submit_button = st.form_submit_button(label="Prever Crimes")
+
+    if submit_button:
+        if not bairro_input or not data_input:
+            st.warning("⚠️ Preencha todos os campos para prever o crime.")
+        else:
+            st.info("ℹ️ O modelo preditivo atual **não utiliza mais latitude e longitude** para a previsão.")
+
+            payload = {
+                "data_ocorrencia": data_input.strftime("%Y-%m-%d"),
+                "bairro": bairro_input,
+                "is_event": 0 if evento_input == "Normal" else 1,
+            }
+
+            api_disponivel = False
+
+            with st.spinner('Consultando o modelo de previsão...'):
+                try:
+                    response = requests.post(API_URL, json=payload, timeout=10)
+
+                    if response.status_code == 200:
+                        predictions = response.json().get("predictions")
+                        st.subheader("🤖 Previsão do Modelo Preditivo")
+
+                        if predictions:
+                            crime_mais_provavel = predictions[0]["tipo_crime"]
+                            probabilidade = predictions[0]["prob"]
+                            st.success(f"**Crime mais provável: {crime_mais_provavel.upper()}**")
+                            st.metric(label="Confiança do Modelo", value=f"{probabilidade:.2%}")
+                            api_disponivel = True
+                    else:
+                        st.error(f"Erro na API de previsão: {response.status_code}")
+                        st.caption(response.text)
+
+                except requests.exceptions.RequestException:
+                    st.warning("Erro: A API de previsão não está respondendo.")
+
+            st.markdown("---")
+
+            st.subheader("📈 Análise do Histórico Local")
+
+            # Cadeia de fallback respondida pelo índice (dados.IndiceHistorico), sem filtrar o DataFrame:
+            # 1. data + bairro + evento; 2. evento no bairro; 3. bairro (qualquer evento);
+            # 4. histórico geral (qualquer bairro/evento), sempre dentro do período selecionado
+            crime_mais_comum, n_historico = carregar_indice_historico().mais_provavel(
+                bairro_input, evento_input, data_input, data_range[0], data_range[1]
+            )
+
+            if crime_mais_comum is None:
+                st.info("❌ Não há ocorrências históricas suficientes para prever o crime nesse bairro/evento.")
+            else:
+                st.success(f"Crime mais provável: **{crime_mais_comum}**")
+                st.info(f"Baseado em {n_historico} ocorrência(s) histórica(s) usadas para previsão.")